@@ -4,8 +4,16 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 import numpy as np
-import BersteinFunctions as bnf
-from animation_manager import AnimationManager
+from numerics import BersteinFunctions as bnf
+from animation_manager import AnimationManager, BlitOverlay
+from compute_jobs import Debouncer
+
+MAX_DEGREE = 2000
+ANIMATION_FRAMES = 60
+# la miscarea sliderului se deseneaza imediat o curba grosiera, iar cea completa dupa o pauza
+PREVIEW_POINTS = 64
+REFINE_DELAY_MS = 150
+INTERVAL_DELAY_MS = 400
 
 class BersteinWindowImp:
     def __init__(self, ui, statusbar, main_window):
@@ -17,13 +25,17 @@ class BersteinWindowImp:
         self.SLIDER_SCALE_FACTOR = 100
         
         self.ui.AB_SLIDER.setMinimum(1)
-        self.ui.AB_SLIDER.setMaximum(50)
+        self.ui.AB_SLIDER.setMaximum(MAX_DEGREE)
         self.ui.AB_SLIDER.setValue(5)
         
         self.setup_bernstein_graph()
+        self.refine_plot = Debouncer(REFINE_DELAY_MS, self.request_plot)
+        self.interval_preview = Debouncer(INTERVAL_DELAY_MS, self.preview_interval)
         
         self.ui.AB_BUTTON_CALCULEAZA.clicked.connect(self.calculeaza_func)
         self.ui.AB_SLIDER.valueChanged.connect(self.update_grad_label)
+        self.ui.AB_SLIDER.valueChanged.connect(self.on_degree_changed)
+        self.ui.AB_INPUT_INTERVAL.textChanged.connect(self.interval_preview)
         self.ui.AB_SLIDER_PUNCT.valueChanged.connect(self.update_punct_label)
         self.ui.AB_BUTTON_INTERVAL.clicked.connect(self.set_interval)
         self.ui.AB_BUTTON_PLAY.clicked.connect(self.start_animation)
@@ -44,13 +56,26 @@ class BersteinWindowImp:
         self.graph_layout.addWidget(self.toolbar)
         self.graph_layout.addWidget(self.canvas)
         
+        self.animation_degree_list = self.animation_degrees()
+        self.animation_x = None
+        self.frame_buffer = None
+        self.frame_buffer_key = None
+        self.approx_line = None
+        self.preview_overlay = BlitOverlay(self.figure)
         self.animation_manager = AnimationManager(
             self.figure,
             self.update_animation_frame,
-            range(1, 51),
-            interval_ms=100
+            range(len(self.animation_degree_list)),
+            interval_ms=100,
+            init_func=self.init_animation,
+            target_fps=30,
+            on_finished=self.on_animation_finished
         )
 
+    def animation_degrees(self):
+        # grade distribuite geometric, ca animatia sa ajunga pana la MAX_DEGREE in acelasi numar de cadre
+        return np.unique(np.geomspace(1, MAX_DEGREE, ANIMATION_FRAMES).astype(int)).tolist()
+
     def get_slider_float_value(self, slider):
         slider_value = slider.value()
         return self.interval_1 + (self.interval_2 - self.interval_1) * (slider_value / self.SLIDER_SCALE_FACTOR)
@@ -78,32 +103,52 @@ class BersteinWindowImp:
         self.animation_manager.stop()
         punct = self.get_slider_float_value(self.ui.AB_SLIDER_PUNCT)
         grad = self.ui.AB_SLIDER.value()
-        try:
-            approximated_value = bnf.aprox_berstein_on_interval(
-                bnf.target_function, punct, grad, self.interval_1, self.interval_2
-            )
+        a, b = self.interval_1, self.interval_2
+
+        def task():
+            approximated_value = bnf.aprox_berstein_on_interval(bnf.target_function, punct, grad, a, b)
             actual_value = bnf.target_function(punct)
+            return approximated_value, actual_value, self.compute_approximation(grad, a, b, punct)
+
+        def show_result(result):
+            approximated_value, actual_value, curves = result
             self.ui.OUTPUT_textfield.setText(f"Aproximare: {approximated_value:.6f} | Valoare implementata in Py: {actual_value:.6f}")
             self.ui.OUTPUTERROR_textfield_.setText(f"{bnf.calculeaza_eroarea_abs(approximated_value, actual_value)}")
             self.statusbar.showMessage("Calcul efectuat cu succes!", 3000)
-        except ValueError as e:
-            QMessageBox.critical(self.main_window, "Eroare de Calcul", str(e))
-            self.statusbar.showMessage("Calcul esuat!", 3000)
-        self.plot_approximation(n_degree=grad)
+            self.draw_approximation(grad, curves)
+
+        self.main_window.compute_jobs.submit("bernstein", task, show_result, self.on_compute_error)
+
+    def on_compute_error(self, error):
+        QMessageBox.critical(self.main_window, "Eroare de Calcul", str(error))
+        self.statusbar.showMessage("Calcul esuat!", 3000)
 
 
     def set_interval(self):
-        self.animation_manager.stop()
+        self.interval_preview.cancel()
         interval_str = self.ui.AB_INPUT_INTERVAL.text()
         parsed_interval_1, parsed_interval_2 = self.parse_interval_string(interval_str)
         if parsed_interval_1 is None or parsed_interval_2 is None:
             self.statusbar.showMessage("Format interval invalid sau valori invalide!", 3000)
             return
-        self.interval_1 = parsed_interval_1
-        self.interval_2 = parsed_interval_2
+        self.apply_interval(parsed_interval_1, parsed_interval_2)
+
+    def preview_interval(self, interval_str):
+        # intervalul se aplica si in timpul tastarii, dar fara mesaje pentru textul incomplet
+        try:
+            a, b = map(float, interval_str.strip().strip('[]').split(','))
+        except ValueError:
+            return
+        if a < b and (a, b) != (self.interval_1, self.interval_2):
+            self.apply_interval(a, b)
+
+    def apply_interval(self, a, b):
+        self.animation_manager.stop()
+        self.interval_1 = a
+        self.interval_2 = b
         self.setup_float_slider(self.ui.AB_SLIDER_PUNCT, self.interval_1, self.interval_2)
         self.update_punct_label(self.ui.AB_SLIDER_PUNCT.value())
-        self.plot_approximation(self.ui.AB_SLIDER.value())
+        self.request_plot(self.ui.AB_SLIDER.value())
 
     def update_grad_label(self, value):
         self.ui.AB_LABEL_GRAD.setText(f"GRAD:{value}")
@@ -112,40 +157,59 @@ class BersteinWindowImp:
         float_value = self.get_slider_float_value(self.ui.AB_SLIDER_PUNCT)
         self.ui.AB_LABEL_PUNCT.setText(f"Punct:{float_value:.3f}")
 
+    @staticmethod
+    def compute_approximation(n_degree, a, b, current_x):
+        # doar calcul numeric, fara widget-uri: poate rula pe un fir de lucru
+        x, y_approx = bnf.aprox_berstein_on_grid(bnf.target_function, n_degree, a, b)
+        _, y_original = bnf.sample_grid(a, b, len(x))
+        return x, y_approx, y_original, current_x, bnf.target_function(current_x)
+
+    def on_degree_changed(self, n_degree):
+        if self.animation_manager.is_running:
+            return
+        if self.animation_manager.is_paused:
+            self.scrub_animation(n_degree)
+            return
+        self.show_preview(n_degree)
+        self.refine_plot(n_degree)
+
+    def show_preview(self, n_degree):
+        # curba grosiera pe firul GUI: doar linia aproximarii se redeseneaza, prin blitting
+        if self.approx_line is None or self.approx_line.axes is None:
+            return
+        # un calcul complet pentru un grad anterior ar suprascrie previzualizarea
+        self.main_window.compute_jobs.cancel("bernstein")
+        x, y_approx = bnf.aprox_berstein_on_grid(
+            bnf.target_function, n_degree, self.interval_1, self.interval_2, PREVIEW_POINTS
+        )
+        self.approx_line.set_data(x, y_approx)
+        if not self.preview_overlay.is_attached:
+            self.preview_overlay.attach([self.approx_line])
+        self.preview_overlay.update()
+
+    def request_plot(self, n_degree):
+        # graficul se recalculeaza in fundal; o cerere noua o inlocuieste pe cea in curs
+        if self.animation_manager.is_running:
+            return
+        task_args = (n_degree, self.interval_1, self.interval_2, self.get_slider_float_value(self.ui.AB_SLIDER_PUNCT))
+        self.main_window.compute_jobs.submit(
+            "bernstein",
+            lambda: self.compute_approximation(*task_args),
+            lambda curves: self.draw_approximation(n_degree, curves),
+            self.on_compute_error
+        )
+
     def plot_approximation(self, n_degree):
-        self.axes.clear()
-        
-        x = np.linspace(self.interval_1, self.interval_2, 1000)
-        y_original = [bnf.target_function(xi) for xi in x]
-        y_approx = [bnf.aprox_berstein_on_interval(bnf.target_function, xi, n_degree, self.interval_1, self.interval_2) for xi in x]
-        
-        self.axes.plot(x, y_original, 'b-', label='Functia implementata in Py')
-        self.axes.plot(x, y_approx, 'r--', label=f'Bernstein (n={n_degree})')
-        
         current_x = self.get_slider_float_value(self.ui.AB_SLIDER_PUNCT)
-        current_y = bnf.target_function(current_x)
-        self.axes.plot(current_x, current_y, 'go', label='Punct Ales')
-        
-        self.axes.grid(True)
-        self.axes.legend()
-        self.axes.set_title('Aproximare Berstein')
-        self.axes.set_xlabel('x')
-        self.axes.set_ylabel('y')
-        self.canvas.draw()
+        self.draw_approximation(n_degree, self.compute_approximation(n_degree, self.interval_1, self.interval_2, current_x))
 
-    def update_animation_frame(self, frame):
+    def draw_approximation(self, n_degree, curves):
+        x, y_approx, y_original, current_x, current_y = curves
         self.axes.clear()
-        n_degree = frame + 1
-        
-        x = np.linspace(self.interval_1, self.interval_2, 1000)
-        y_original = [bnf.target_function(xi) for xi in x]
-        y_approx = [bnf.aprox_berstein_on_interval(bnf.target_function, xi, n_degree, self.interval_1, self.interval_2) for xi in x]
         
         self.axes.plot(x, y_original, 'b-', label='Functia implementata in Py')
-        self.axes.plot(x, y_approx, 'r--', label=f'Bernstein (n={n_degree})')
+        self.approx_line, = self.axes.plot(x, y_approx, 'r--', label=f'Bernstein (n={n_degree})')
         
-        current_x = self.get_slider_float_value(self.ui.AB_SLIDER_PUNCT)
-        current_y = bnf.target_function(current_x)
         self.axes.plot(current_x, current_y, 'go', label='Punct Ales')
         
         self.axes.grid(True)
@@ -153,14 +217,80 @@ class BersteinWindowImp:
         self.axes.set_title('Aproximare Berstein')
         self.axes.set_xlabel('x')
         self.axes.set_ylabel('y')
-        
+        # desenul complet salveaza si fundalul pentru previzualizarile urmatoare
+        self.preview_overlay.attach([self.approx_line])
+
+    def prepare_animation_frames(self):
+        # cadrele se calculeaza o singura data pentru un interval si se refolosesc la reluare
+        key = (self.interval_1, self.interval_2)
+        if self.frame_buffer is None or self.frame_buffer_key != key:
+            self.animation_x, self.frame_buffer = bnf.bernstein_frame_buffer(
+                bnf.target_function, self.animation_degree_list, self.interval_1, self.interval_2
+            )
+            self.frame_buffer_key = key
+        self.plot_approximation(self.animation_degree_list[0])
+        # legenda face parte din fundalul static, nu se mai actualizeaza pe cadre
+        self.approx_line.set_label('Bernstein (animatie)')
+        self.axes.legend()
+
+    def init_animation(self):
+        self.refine_plot.cancel()
+        self.prepare_animation_frames()
+        # de aici linia e redesenata de AnimationManager
+        self.preview_overlay.detach()
+        return [self.approx_line]
+
+    def show_frame(self, index):
+        n_degree = self.animation_degree_list[index]
+        self.approx_line.set_ydata(self.frame_buffer[index])
+        self.ui.AB_SLIDER.blockSignals(True)
         self.ui.AB_SLIDER.setValue(n_degree)
-        
-        return self.axes.get_lines() + self.axes.collections
+        self.ui.AB_SLIDER.blockSignals(False)
+        self.update_grad_label(n_degree)
+        return self.approx_line
+
+    def update_animation_frame(self, frame):
+        return [self.show_frame(frame)]
+
+    def scrub_animation(self, n_degree):
+        # in pauza sliderul de grad deruleaza inainte/inapoi prin tabloul de cadre,
+        # la cel mai apropiat grad calculat; Play reia animatia de acolo
+        index = int(np.argmin(np.abs(np.asarray(self.animation_degree_list) - n_degree)))
+        self.animation_manager.seek(index)
+
+    def on_target_changed(self):
+        # cadrele salvate sunt ale functiei vechi
+        self.animation_manager.stop()
+        self.frame_buffer = None
+        self.request_plot(self.ui.AB_SLIDER.value())
 
     def start_animation(self):
-        print("ANIMATION")
-        self.animation_manager.start()
+        # Play comuta intre redare si pauza
+        if self.animation_manager.is_running:
+            self.animation_manager.pause()
+            self.statusbar.showMessage("Animatie in pauza: sliderul de grad deruleaza cadrele", 5000)
+            return
+        key = (self.interval_1, self.interval_2)
+        if self.animation_manager.is_paused or (self.frame_buffer is not None and self.frame_buffer_key == key):
+            self.animation_manager.start()
+            return
+        # tabloul de cadre (pana la MAX_DEGREE) se calculeaza in fundal, animatia porneste cand e gata
+        degrees = list(self.animation_degree_list)
+
+        def store_frames(result):
+            self.animation_x, self.frame_buffer = result
+            self.frame_buffer_key = key
+            self.animation_manager.start()
+
+        self.main_window.compute_jobs.submit(
+            "bernstein",
+            lambda: bnf.bernstein_frame_buffer(bnf.target_function, degrees, *key),
+            store_frames,
+            self.on_compute_error
+        )
 
     def stop_animation(self):
         self.animation_manager.stop()
+
+    def on_animation_finished(self, stats):
+        self.statusbar.showMessage(f"Animatie: {stats}", 5000)
@@ -6,8 +6,8 @@ from PyQt5.QtWidgets import QMessageBox
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-import LagrangeFunctions as lf
-from matplotlib.animation import FuncAnimation
+from numerics import LagrangeFunctions as lf
+from animation_manager import AnimationManager
 
 class LagrangeWindowImp:
     def __init__(self, ui, statusbar, parent_widget):
@@ -19,7 +19,17 @@ class LagrangeWindowImp:
         self.lagrange_figure = None
         self.lagrange_canvas = None
         self.lagrange_axes = None
-        self.animation = None
+        self.animation_manager = None
+        self.anim_scatter = None
+        self.anim_line = None
+        self.anim_interpolant = None
+        self.anim_node_order = []
+        self.nested_checkbox = None
+        self.node_type_combo = None
+        self.interpolant = None
+        self.interp_line = None
+        self.points_scatter = None
+        self.target_line = None
         self.current_points = 0
         self.max_points = 0
         self.animation_interval = 500
@@ -32,6 +42,16 @@ class LagrangeWindowImp:
         self.setup_lagrange_graph()
         self.ui.IL_BUTTON_ADAUGA.clicked.connect(self.add_lagrange_point)
         self.ui.IL_BUTTON_PLAY.clicked.connect(self.start_animation)
+        
+        # cu noduri imbricate animatia adauga cate un nod la interpolantul existent
+        self.nested_checkbox = QtWidgets.QCheckBox("Noduri imbricate (animatie incrementala)")
+        play_index = self.ui.verticalLayout_2.indexOf(self.ui.IL_BUTTON_PLAY)
+        self.ui.verticalLayout_2.insertWidget(play_index, self.nested_checkbox)
+        
+        self.node_type_combo = QtWidgets.QComboBox()
+        self.node_type_combo.addItems(["Noduri echidistante", "Noduri Cebisev"])
+        nodes_index = self.ui.verticalLayout_2.indexOf(self.ui.IL_TEXTFIELD_NODURI)
+        self.ui.verticalLayout_2.insertWidget(nodes_index + 1, self.node_type_combo)
 
     def setup_lagrange_graph(self):
         self.lagrange_figure = Figure(figsize=(5, 4), dpi=100)
@@ -43,12 +63,24 @@ class LagrangeWindowImp:
         self.lagrange_graph_layout.addWidget(self.lagrange_toolbar)
         self.lagrange_graph_layout.addWidget(self.lagrange_canvas)
         
+        self.animation_manager = AnimationManager(
+            self.lagrange_figure,
+            self.update_animation,
+            range(0),
+            interval_ms=self.animation_interval,
+            init_func=self.init_animation,
+            on_finished=self.on_animation_finished
+        )
+        
         self.lagrange_axes.text(0.5, 0.5, '',
                               horizontalalignment='center',
                               verticalalignment='center',
                               transform=self.lagrange_axes.transAxes)
         self.lagrange_canvas.draw()
 
+    def uses_chebyshev_nodes(self):
+        return self.node_type_combo.currentIndex() == 1
+
     def add_lagrange_point(self):
         try:
             num_nodes_text = self.ui.IL_TEXTFIELD_NODURI.text().strip()
@@ -71,106 +103,169 @@ class LagrangeWindowImp:
             if a >= b:
                 raise ValueError("Startul trebuie sa fie > ca Endul")
             
-            self.interval = (a, b)
-            self.max_points = num_nodes
-            self.current_points = 0
-            
-            x_points = np.linspace(a, b, num_nodes)
-            y_points = [lf.target_function(x) for x in x_points]
-            
-            self.lagrange_x_points = []
-            self.lagrange_y_points = []
-            self.ui.IL_TABEL.setRowCount(0)
-            
-            for x, y in zip(x_points, y_points):
-                self.lagrange_x_points.append(x)
-                self.lagrange_y_points.append(y)
-                row = self.ui.IL_TABEL.rowCount()
-                self.ui.IL_TABEL.insertRow(row)
-                self.ui.IL_TABEL.setItem(row, 0, QtWidgets.QTableWidgetItem(f"{x:.4f}"))
-                self.ui.IL_TABEL.setItem(row, 1, QtWidgets.QTableWidgetItem(f"{y:.4f}"))
-            
-            x_eval = (a + b) / 2
-            interpolated_value = lf.lagrange_interpolation(self.lagrange_x_points, self.lagrange_y_points, x_eval)
-            actual_value = lf.target_function(x_eval)
-            
-            max_error = lf.calculate_interpolation_error(self.lagrange_x_points, self.lagrange_y_points)
-            
-            self.ui.IL_TEXTFIELD_OUTPUT.setText(f"Val Interpolarii: {interpolated_value:.6f} |Functia in py: {actual_value:.6f}")
-            self.ui.IL_TEXTFIELD_ERROR.setText(f"{max_error:.6f}")
-            
-            self.plot_lagrange()
+            self.animation_manager.stop()
+            chebyshev = self.uses_chebyshev_nodes()
+            self.parent_widget.compute_jobs.submit(
+                "lagrange",
+                lambda: self.compute_interpolation(a, b, num_nodes, chebyshev),
+                self.show_interpolation,
+                self.on_compute_error
+            )
             
         except ValueError as e:
-            QMessageBox.warning(self.ui, "Error", str(e))
+            QMessageBox.warning(self.parent_widget, "Error", str(e))
+
+    def on_compute_error(self, error):
+        QMessageBox.warning(self.parent_widget, "Error", str(error))
+
+    @staticmethod
+    def compute_interpolation(a, b, num_nodes, chebyshev):
+        # doar calcul numeric, fara widget-uri: ruleaza pe un fir de lucru
+        if chebyshev:
+            x_points = lf.chebyshev_nodes(a, b, num_nodes)
+            y_points = lf.sample_nodes(x_points)
+            interpolant = lf.ChebyshevInterpolant.from_values(y_points, a, b)
+        else:
+            x_points = np.linspace(a, b, num_nodes)
+            y_points = lf.sample_nodes(x_points)
+            interpolant = lf.BarycentricInterpolant(x_points, y_points)
+        
+        x_eval = (a + b) / 2
+        result = {
+            "interval": (a, b),
+            "chebyshev": chebyshev,
+            "x_points": x_points,
+            "y_points": y_points,
+            "interpolant": interpolant,
+            "interpolated_value": float(interpolant(x_eval)),
+            "actual_value": lf.target_function(x_eval),
+            # nodurile Chebyshev nu includ capetele: eroarea si curbele se evalueaza pe tot [a, b]
+            "max_error": lf.calculate_interpolation_error(x_points, y_points, interpolant=interpolant, a=a, b=b),
+            "curves": lf.compute_lagrange_curves(x_points, y_points, interpolant=interpolant, a=a, b=b),
+        }
+        if chebyshev:
+            # aceeasi eroare pe nodurile echidistante, pentru comparatie
+            x_equi = np.linspace(a, b, num_nodes)
+            with np.errstate(all='ignore'):
+                result["equi_error"] = lf.calculate_interpolation_error(x_equi, lf.sample_nodes(x_equi), a=a, b=b)
+        return result
+
+    def show_interpolation(self, result):
+        x_points, y_points = result["x_points"], result["y_points"]
+        self.interval = result["interval"]
+        self.max_points = len(x_points)
+        self.current_points = 0
+        self.interpolant = result["interpolant"]
+        self.lagrange_x_points = list(x_points)
+        self.lagrange_y_points = list(y_points)
+        self.ui.IL_TABEL.setRowCount(len(x_points))
+        
+        for row, (x, y) in enumerate(zip(x_points, y_points)):
+            self.ui.IL_TABEL.setItem(row, 0, QtWidgets.QTableWidgetItem(f"{x:.4f}"))
+            self.ui.IL_TABEL.setItem(row, 1, QtWidgets.QTableWidgetItem(f"{y:.4f}"))
+        
+        self.ui.IL_TEXTFIELD_OUTPUT.setText(f"Val Interpolarii: {result['interpolated_value']:.6f} |Functia in py: {result['actual_value']:.6f}")
+        if result["chebyshev"]:
+            self.ui.IL_TEXTFIELD_ERROR.setText(f"Cebisev: {result['max_error']:.6e} | Echidistant: {result['equi_error']:.6e}")
+        else:
+            self.ui.IL_TEXTFIELD_ERROR.setText(f"{result['max_error']:.6f}")
+        
+        self.draw_lagrange(*result["curves"])
+
+    def on_target_changed(self):
+        # nodurile raman aceleasi, doar valorile se recalculeaza
+        if self.lagrange_x_points:
+            self.add_lagrange_point()
+
+    def init_animation(self):
+        a, b = self.interval
+        self.current_points = 0
+        self.anim_interpolant = lf.BarycentricInterpolant()
+        self.anim_node_order = lf.nested_node_order(self.max_points)
+        self.lagrange_axes.clear()
+        
+        x_plot, y_target = lf.sample_grid(a, b, 1000)
+        self.lagrange_axes.plot(x_plot, y_target, 'g--', label='Functia Originala')
+        
+        self.anim_scatter = self.lagrange_axes.scatter([], [], color='red', label='Punctele de interpolare')
+        self.anim_line, = self.lagrange_axes.plot(x_plot, np.full_like(x_plot, np.nan), 'b-', label='Interpolarea Lagrange')
+        
+        # axele raman fixe pe durata animatiei, fundalul nu se mai redeseneaza
+        y_min, y_max = float(np.min(y_target)), float(np.max(y_target))
+        margin = 0.5 * (y_max - y_min or 1.0)
+        self.lagrange_axes.set_xlim(a, b)
+        self.lagrange_axes.set_ylim(y_min - margin, y_max + margin)
+        self.lagrange_axes.grid(True)
+        self.lagrange_axes.legend()
+        self.lagrange_axes.set_title(f'Interpolarea Lagrange (maxim {self.max_points} puncte)')
+        self.lagrange_axes.set_xlabel('x')
+        self.lagrange_axes.set_ylabel('y')
+        
+        return [self.anim_scatter, self.anim_line]
 
     def update_animation(self, frame):
-        if self.current_points < self.max_points:
-            self.current_points += 1
+        # cadrele pot fi sarite de planificator, numarul de puncte vine din cadru
+        if frame < self.max_points:
+            self.current_points = frame + 1
             a, b = self.interval
             
-            x_points = np.linspace(a, b, self.current_points)
-            y_points = [lf.target_function(x) for x in x_points]
-            
-            self.lagrange_axes.clear()
-            
-            x_plot = np.linspace(a, b, 1000)
-            y_target = [lf.target_function(x) for x in x_plot]
-            self.lagrange_axes.plot(x_plot, y_target, 'g--', label='Functia Originala')
+            if self.nested_checkbox.isChecked():
+                # nodurile noi se adauga in O(n) la ponderile existente
+                for index in self.anim_node_order[len(self.anim_interpolant):self.current_points]:
+                    self.anim_interpolant.add_node(self.lagrange_x_points[index], self.lagrange_y_points[index])
+                x_points = self.anim_interpolant.x_points
+                y_points = self.anim_interpolant.y_points
+                interpolant = self.anim_interpolant
+            elif self.uses_chebyshev_nodes():
+                x_points = lf.chebyshev_nodes(a, b, self.current_points)
+                y_points = lf.sample_nodes(x_points)
+                interpolant = lf.ChebyshevInterpolant.from_values(y_points, a, b)
+            else:
+                x_points = np.linspace(a, b, self.current_points)
+                y_points = lf.sample_nodes(x_points)
+                interpolant = lf.BarycentricInterpolant(x_points, y_points)
             
-            self.lagrange_axes.scatter(x_points, y_points, color='red', label='Punctele de interpolare')
+            x_plot = self.anim_line.get_xdata()
+            y_interp = interpolant(x_plot)
             
-            y_interp = [lf.lagrange_interpolation(x_points, y_points, x) for x in x_plot]
-            self.lagrange_axes.plot(x_plot, y_interp, 'b-', label='Interpolarea Lagrange')
+            self.anim_scatter.set_offsets(np.column_stack((x_points, y_points)))
+            self.anim_line.set_ydata(y_interp)
+            self.statusbar.showMessage(f"Interpolarea Lagrange (puncte: {self.current_points})", 1000)
             
-            self.lagrange_axes.grid(True)
-            self.lagrange_axes.legend()
-            self.lagrange_axes.set_title(f'Interpolarea Lagrange (puncte: {self.current_points})')
-            self.lagrange_axes.set_xlabel('x')
-            self.lagrange_axes.set_ylabel('y')
-            
-            self.lagrange_canvas.draw()
-            
-            return self.lagrange_axes.artists
+            return [self.anim_scatter, self.anim_line]
         return []
 
     def start_animation(self):
         if not self.lagrange_x_points:
-            QMessageBox.warning(self.ui, "Warning", "Please add points first")
+            QMessageBox.warning(self.parent_widget, "Warning", "Please add points first")
             return
             
-        if self.animation is None:
-            self.animation = FuncAnimation(
-                self.lagrange_figure,
-                self.update_animation,
-                frames=self.max_points,
-                interval=self.animation_interval,
-                blit=True
-            )
-        else:
-            self.animation.event_source.start()
+        if not self.animation_manager.is_paused:
+            self.animation_manager.frames_range = range(self.max_points)
+        self.animation_manager.start()
 
-    def plot_lagrange(self):
-        try:
-            if not self.lagrange_x_points:
-                raise ValueError("No points available for interpolation. Please add points first.")
-            
-            fig, ax = lf.plot_lagrange_interpolation(
-                self.lagrange_x_points,
-                self.lagrange_y_points
-            )
-            
-            self.lagrange_axes.clear()
-            self.lagrange_axes.plot(ax.lines[0].get_xdata(), ax.lines[0].get_ydata(), 'b-', label='Interpolarea Lagrange')
-            self.lagrange_axes.scatter(self.lagrange_x_points, self.lagrange_y_points, color='red', label='Punctele Interpolarii')
-            self.lagrange_axes.plot(ax.lines[1].get_xdata(), ax.lines[1].get_ydata(), 'g--', label='Functia in py')
-            self.lagrange_axes.grid(True)
-            self.lagrange_axes.legend()
-            self.lagrange_axes.set_title('Interpolarea Lagrange')
-            self.lagrange_axes.set_xlabel('x')
-            self.lagrange_axes.set_ylabel('y')
-            
-            self.lagrange_canvas.draw()
-            
-        except ValueError as e:
-            QMessageBox.warning(self.ui, "Error", str(e))
+    def on_animation_finished(self, stats):
+        self.statusbar.showMessage(f"Animatie: {stats}", 5000)
+
+    def setup_lagrange_artists(self):
+        # artistii persistenti ai graficului static; animatia goleste axele, deci se refac la nevoie
+        self.lagrange_axes.clear()
+        self.interp_line, = self.lagrange_axes.plot([], [], 'b-', label='Interpolarea Lagrange')
+        self.points_scatter = self.lagrange_axes.scatter([], [], color='red', label='Punctele Interpolarii')
+        self.target_line, = self.lagrange_axes.plot([], [], 'g--', label='Functia in py')
+        self.lagrange_axes.grid(True)
+        self.lagrange_axes.legend()
+        self.lagrange_axes.set_title('Interpolarea Lagrange')
+        self.lagrange_axes.set_xlabel('x')
+        self.lagrange_axes.set_ylabel('y')
+
+    def draw_lagrange(self, x_plot, y_interp, y_target):
+        if self.interp_line is None or self.interp_line.axes is None:
+            self.setup_lagrange_artists()
+        self.interp_line.set_data(x_plot, y_interp)
+        self.points_scatter.set_offsets(np.column_stack((self.lagrange_x_points, self.lagrange_y_points)))
+        self.target_line.set_data(x_plot, y_target)
+        self.lagrange_axes.relim()
+        self.lagrange_axes.autoscale_view()
+        
+        self.lagrange_canvas.draw_idle()
@@ -4,7 +4,11 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 import numpy as np
-import SplineFunctions as sf
+from numerics import SplineFunctions as sf
+from compute_jobs import Debouncer
+
+# Rapid edits (typing, spin box arrows) are applied once the input is idle
+INPUT_DELAY_MS = 250
 
 class SplineWindowImp:
     def __init__(self, ui, statusbar, main_window):
@@ -15,18 +19,79 @@ class SplineWindowImp:
         # Initialize variables
         self.x_points = np.array([])
         self.y_points = np.array([])
+        self.spline = None
+        self.spline_key = None
+        self.drag_index = None
+        self.interp_line = None
+        self.points_scatter = None
+        self.x_plot = None
         
         # Set up the graph
         self.setup_spline_graph()
         
         # Connect signals
+        self.pending_clear = Debouncer(INPUT_DELAY_MS, lambda *_: self.clear_points())
+        self.pending_refit = Debouncer(INPUT_DELAY_MS, lambda *_: self.on_spline_type_changed())
         self.ui.IS_BUTTON_CALCULEAZA.clicked.connect(self.calculate_spline)
-        self.ui.IS_TEXTFIELD_INTERVAL.textChanged.connect(self.clear_points)
-        self.ui.IS_TEXTFIELD_NODURI.textChanged.connect(self.clear_points)
+        self.ui.IS_TEXTFIELD_INTERVAL.textChanged.connect(self.pending_clear)
+        self.ui.IS_TEXTFIELD_NODURI.textChanged.connect(self.pending_clear)
         self.ui.IS_RADIO_LINIAR.toggled.connect(self.on_spline_type_changed)
         self.ui.IS_RADIO_PATRATIC.toggled.connect(self.on_spline_type_changed)
         self.ui.IS_RADIO_CUBIC.toggled.connect(self.on_spline_type_changed)
         
+        # Boundary conditions for the cubic spline, placed under the cubic option
+        self.bc_combo = QtWidgets.QComboBox()
+        self.bc_combo.addItems(sf.CUBIC_BOUNDARY_CONDITIONS)
+        self.bc_combo.setEnabled(False)
+        cubic_index = self.ui.verticalLayout_12.indexOf(self.ui.IS_RADIO_CUBIC)
+        self.ui.verticalLayout_12.insertWidget(cubic_index + 1, self.bc_combo)
+        self.ui.IS_RADIO_CUBIC.toggled.connect(self.bc_combo.setEnabled)
+        self.bc_combo.currentIndexChanged.connect(self.on_spline_type_changed)
+        
+        # General B-spline of any degree, added after the fixed-degree options
+        self.bspline_radio = QtWidgets.QRadioButton("B-spline")
+        self.degree_spin = QtWidgets.QSpinBox()
+        self.degree_spin.setRange(1, 15)
+        self.degree_spin.setValue(3)
+        self.degree_spin.setPrefix("Degree: ")
+        self.degree_spin.setEnabled(False)
+        bc_index = self.ui.verticalLayout_12.indexOf(self.bc_combo)
+        self.ui.verticalLayout_12.insertWidget(bc_index + 1, self.bspline_radio)
+        self.ui.verticalLayout_12.insertWidget(bc_index + 2, self.degree_spin)
+        self.bspline_radio.toggled.connect(self.degree_spin.setEnabled)
+        self.bspline_radio.toggled.connect(self.on_spline_type_changed)
+        self.degree_spin.valueChanged.connect(self.pending_refit)
+        
+        # Least-squares smoothing spline on fewer knots than data points
+        self.smoothing_radio = QtWidgets.QRadioButton("Smoothing (least squares)")
+        self.knots_spin = QtWidgets.QSpinBox()
+        # 0 lets the fitter pick the knot count from the number of nodes
+        self.knots_spin.setRange(0, 100000)
+        self.knots_spin.setValue(0)
+        self.knots_spin.setPrefix("Knots: ")
+        self.knots_spin.setSpecialValueText("Knots: auto")
+        self.smoothing_spin = QtWidgets.QDoubleSpinBox()
+        self.smoothing_spin.setRange(0.0, 1e6)
+        self.smoothing_spin.setDecimals(4)
+        self.smoothing_spin.setPrefix("Smoothing: ")
+        degree_index = self.ui.verticalLayout_12.indexOf(self.degree_spin)
+        for offset, widget in enumerate((self.smoothing_radio, self.knots_spin, self.smoothing_spin), 1):
+            self.ui.verticalLayout_12.insertWidget(degree_index + offset, widget)
+        for widget in (self.knots_spin, self.smoothing_spin):
+            widget.setEnabled(False)
+            self.smoothing_radio.toggled.connect(widget.setEnabled)
+            widget.valueChanged.connect(self.pending_refit)
+        self.smoothing_radio.toggled.connect(self.on_spline_type_changed)
+        
+        # Overlays computed from the fitted coefficients
+        self.derivative_check = QtWidgets.QCheckBox("Show f'")
+        self.second_derivative_check = QtWidgets.QCheckBox("Show f''")
+        self.area_check = QtWidgets.QCheckBox("Area under curve")
+        overlay_index = self.ui.verticalLayout_12.indexOf(self.smoothing_spin)
+        for offset, widget in enumerate((self.derivative_check, self.second_derivative_check, self.area_check), 1):
+            self.ui.verticalLayout_12.insertWidget(overlay_index + offset, widget)
+            widget.toggled.connect(self.on_spline_type_changed)
+        
         # Set up table
         self.ui.IL_TABEL_2.setColumnCount(2)
         self.ui.IL_TABEL_2.setHorizontalHeaderLabels(['X', 'Y'])
@@ -44,8 +109,10 @@ class SplineWindowImp:
 
     def clear_points(self):
         """Clear the current points and reset the plot"""
+        self.main_window.compute_jobs.cancel("spline")
         self.x_points = np.array([])
         self.y_points = np.array([])
+        self.spline = None
         self.ui.IS_TEXTFIELD_OUTPUT.clear()
         self.ui.IS_TEXTFIELD_ERROR.clear()
         self.ui.IL_TABEL_2.setRowCount(0)
@@ -56,11 +123,18 @@ class SplineWindowImp:
                       transform=self.axes.transAxes)
         self.canvas.draw()
 
+    def on_target_changed(self):
+        """Resample the nodes for the new target function"""
+        had_points = self.x_points.size > 0
+        self.clear_points()
+        if had_points:
+            self.calculate_spline()
+
     def on_spline_type_changed(self):
         """Handle spline type changes"""
         if self.x_points.size > 0:
             spline_type = self.get_spline_type()
-            self.plot_spline(spline_type)
+            self.fit_in_background(spline_type, lambda spline: self.plot_spline(spline_type))
 
     def setup_spline_graph(self):
         """Set up the graph for spline interpolation"""
@@ -78,6 +152,11 @@ class SplineWindowImp:
         # Set the layout to the widget
         self.ui.IS_WIG_GRAF.setLayout(self.graph_layout)
         
+        # Points can be dragged vertically; the fit is updated locally
+        self.canvas.mpl_connect('button_press_event', self.on_drag_start)
+        self.canvas.mpl_connect('motion_notify_event', self.on_drag_move)
+        self.canvas.mpl_connect('button_release_event', self.on_drag_end)
+        
         # Add initial message to the plot
         self.axes.text(0.5, 0.5, 'Adaugă puncte pentru interpolare',
                       horizontalalignment='center',
@@ -120,19 +199,19 @@ class SplineWindowImp:
             
             # Check minimum number of points based on spline type
             spline_type = self.get_spline_type()
-            min_points = {"linear": 2, "quadratic": 3, "cubic": 4}[spline_type]
+            min_points = {"linear": 2, "quadratic": 3, "cubic": 4, "smoothing": 2}.get(
+                spline_type, self.degree_spin.value() + 1)
             if num_nodes < min_points:
                 raise ValueError(f"Number of nodes must be at least {min_points} for {spline_type} spline")
             
             # Generate points
             self.x_points = np.linspace(a, b, num_nodes)
-            self.y_points = np.array([sf.target_function(x) for x in self.x_points])
+            # Own copy: dragging edits the values, the cached samples are read-only
+            self.y_points = sf.sample_nodes(self.x_points).copy()
+            self.spline = None
             
             # Update table
-            sf.update_table(self.ui.IL_TABEL_2, self.x_points, self.y_points)
-            
-            # Plot initial points
-            self.plot_spline(spline_type)
+            self.update_table()
             
             return True
             
@@ -140,6 +219,14 @@ class SplineWindowImp:
             self.statusbar.showMessage(str(e), 3000)
             return False
 
+    def update_table(self):
+        """Update the table with interpolation points"""
+        table = self.ui.IL_TABEL_2
+        table.setRowCount(len(self.x_points))
+        for i, (x, y) in enumerate(zip(self.x_points, self.y_points)):
+            table.setItem(i, 0, QtWidgets.QTableWidgetItem(f"{x:.6f}"))
+            table.setItem(i, 1, QtWidgets.QTableWidgetItem(f"{y:.6f}"))
+
     def get_spline_type(self):
         """Get the selected spline type"""
         if self.ui.IS_RADIO_LINIAR.isChecked():
@@ -148,11 +235,68 @@ class SplineWindowImp:
             return "quadratic"
         elif self.ui.IS_RADIO_CUBIC.isChecked():
             return "cubic"
+        elif self.bspline_radio.isChecked():
+            return "bspline"
+        elif self.smoothing_radio.isChecked():
+            return "smoothing"
         else:
             raise ValueError("No spline type selected")
 
+    def get_spline_options(self, spline_type):
+        """Extra fit options for the selected spline type"""
+        if spline_type == "cubic":
+            return {"bc_type": self.bc_combo.currentText()}
+        if spline_type == "bspline":
+            return {"degree": self.degree_spin.value()}
+        if spline_type == "smoothing":
+            return {"num_knots": self.knots_spin.value() or None, "smoothing": self.smoothing_spin.value()}
+        return {}
+
+    def get_fitted_spline(self, spline_type):
+        """Return the fit for the current points, fitting only when the data or type changed"""
+        options = self.get_spline_options(spline_type)
+        key = (spline_type, tuple(sorted(options.items())))
+        if self.spline is None or self.spline_key != key:
+            self.spline = sf.fit_spline(self.x_points, self.y_points, spline_type, **options)
+            self.spline_key = key
+        return self.spline
+
+    def fit_in_background(self, spline_type, on_fitted):
+        """Fit on a worker thread, then call on_fitted(spline) on the GUI thread with the fit cached"""
+        options = self.get_spline_options(spline_type)
+        key = (spline_type, tuple(sorted(options.items())))
+        if self.spline is not None and self.spline_key == key:
+            # A fit still running for another type is now stale
+            self.main_window.compute_jobs.cancel("spline")
+            on_fitted(self.spline)
+            return
+        
+        # The worker gets its own copies, dragging keeps editing the window's arrays
+        x_points, y_points = self.x_points.copy(), self.y_points.copy()
+        
+        def store(spline):
+            self.spline = spline
+            self.spline_key = key
+            on_fitted(spline)
+        
+        self.main_window.compute_jobs.submit(
+            "spline",
+            lambda: sf.fit_spline(x_points, y_points, spline_type, **options),
+            store,
+            self.on_fit_failed
+        )
+
+    def on_fit_failed(self, error):
+        """Drop the result of the previous fit so it is not shown for the new settings"""
+        self.ui.IS_TEXTFIELD_OUTPUT.clear()
+        self.ui.IS_TEXTFIELD_ERROR.clear()
+        self.statusbar.showMessage(f"Error calculating spline: {error}", 3000)
+
     def calculate_spline(self):
         """Calculate spline interpolation at the given point"""
+        # Apply edits still waiting for the input to go idle
+        self.pending_clear.flush()
+        self.pending_refit.cancel()
         try:
             # First, generate points if not already done
             if not self.x_points.size or not self.y_points.size:
@@ -181,42 +325,40 @@ class SplineWindowImp:
                 QMessageBox.warning(self.main_window, "Warning", 
                                   f"Point {x_eval} is outside the interpolation range [{x_min:.2f}, {x_max:.2f}]")
             
-            # Calculate interpolation
-            try:
-                if spline_type == "linear":
-                    result = sf.linear_spline(self.x_points, self.y_points, x_eval)
-                elif spline_type == "quadratic":
-                    result = sf.quadratic_spline(self.x_points, self.y_points, x_eval)
-                else:  # cubic
-                    result = sf.cubic_spline(self.x_points, self.y_points, x_eval)
-                
-                # Calculate error
-                error = sf.calculate_error(self.x_points, self.y_points, spline_type)
-                
-                # Format results with 6 decimal places
-                result_str = f"{result:.6f}"
-                error_str = f"{error:.6f}"
-                
-                # Update text fields
-                self.ui.IS_TEXTFIELD_OUTPUT.setText(result_str)
-                self.ui.IS_TEXTFIELD_ERROR.setText(error_str)
-                
-                # Update plot
-                self.plot_spline(spline_type)
-                
-                # Show success message with values
-                self.statusbar.showMessage(
-                    f"{spline_type.capitalize()} spline: f({x_eval:.2f}) = {result_str}, Error = {error_str}", 
-                    3000
-                )
-                
-            except Exception as e:
-                self.statusbar.showMessage(f"Error calculating spline: {str(e)}", 3000)
-                return
+            # Fit in the background, evaluate and show the results when it is done
+            self.fit_in_background(spline_type, lambda spline: self.show_result(spline, spline_type, x_eval))
             
         except Exception as e:
             self.statusbar.showMessage(f"Error: {str(e)}", 3000)
 
+    def show_result(self, spline, spline_type, x_eval):
+        """Show the value at x_eval, the error and the plot for a finished fit"""
+        try:
+            result = float(spline(x_eval))
+            
+            # Calculate error
+            error = sf.calculate_error(self.x_points, self.y_points, spline_type, spline=spline)
+            
+            # Format results with 6 decimal places
+            result_str = f"{result:.6f}"
+            error_str = f"{error:.6f}"
+            
+            # Update text fields
+            self.ui.IS_TEXTFIELD_OUTPUT.setText(result_str)
+            self.ui.IS_TEXTFIELD_ERROR.setText(error_str)
+            
+            # Update plot
+            self.plot_spline(spline_type)
+            
+            # Show success message with values
+            message = f"{spline_type.capitalize()} spline: f({x_eval:.2f}) = {result_str}, Error = {error_str}"
+            if getattr(spline, "residual_norm", None) is not None:
+                message += f", Residual norm = {float(spline.residual_norm):.6g}"
+            self.statusbar.showMessage(message, 3000)
+            
+        except Exception as e:
+            self.statusbar.showMessage(f"Error calculating spline: {str(e)}", 3000)
+
     def plot_spline(self, spline_type):
         """Plot the spline interpolation"""
         try:
@@ -225,23 +367,26 @@ class SplineWindowImp:
             
             # Generate points for plotting
             x_min, x_max = np.min(self.x_points), np.max(self.x_points)
-            x_plot = np.linspace(x_min, x_max, 1000)
+            x_plot, y_actual = sf.sample_grid(x_min, x_max, 1000)
             
             # Calculate interpolated values
-            if spline_type == "linear":
-                y_interp = np.array([sf.linear_spline(self.x_points, self.y_points, x) for x in x_plot])
-            elif spline_type == "quadratic":
-                y_interp = np.array([sf.quadratic_spline(self.x_points, self.y_points, x) for x in x_plot])
-            else:  # cubic
-                y_interp = sf.cubic_spline(self.x_points, self.y_points, x_plot)
-            
-            # Calculate actual values
-            y_actual = np.array([sf.target_function(x) for x in x_plot])
+            y_interp = self.get_fitted_spline(spline_type)(x_plot)
             
             # Plot the results
-            self.axes.plot(x_plot, y_interp, 'b-', label=f'{spline_type.capitalize()} Spline')
+            self.x_plot = x_plot
+            self.interp_line, = self.axes.plot(x_plot, y_interp, 'b-', label=f'{spline_type.capitalize()} Spline')
             self.axes.plot(x_plot, y_actual, 'g--', label='Original Function')
-            self.axes.scatter(self.x_points, self.y_points, color='red', label='Interpolation Points')
+            self.points_scatter = self.axes.scatter(self.x_points, self.y_points, color='red', label='Interpolation Points')
+            
+            # Derivative and area overlays, straight from the fitted coefficients
+            spline = self.get_fitted_spline(spline_type)
+            if self.derivative_check.isChecked():
+                self.axes.plot(x_plot, spline.derivative()(x_plot), 'm:', label="f'")
+            if self.second_derivative_check.isChecked():
+                self.axes.plot(x_plot, spline.derivative(2)(x_plot), 'c:', label="f''")
+            if self.area_check.isChecked():
+                area = float(spline.integral(x_min, x_max))
+                self.axes.fill_between(x_plot, y_interp, alpha=0.2, label=f'Area = {area:.6f}')
             
             # Add labels and grid
             self.axes.grid(True)
@@ -255,3 +400,46 @@ class SplineWindowImp:
             
         except Exception as e:
             self.statusbar.showMessage(f"Failed to update plot: {str(e)}", 3000)
+
+    def on_drag_start(self, event):
+        """Pick the interpolation point closest to the click"""
+        if (self.points_scatter is None or event.inaxes is not self.axes
+                or self.toolbar.mode or not self.x_points.size):
+            return
+        points = self.axes.transData.transform(np.column_stack((self.x_points, self.y_points)))
+        distances = np.hypot(points[:, 0] - event.x, points[:, 1] - event.y)
+        nearest = int(np.argmin(distances))
+        if distances[nearest] <= 8:
+            self.drag_index = nearest
+
+    def on_drag_move(self, event):
+        """Move the dragged point and refresh the curve from the local update"""
+        if self.drag_index is None or event.inaxes is not self.axes or event.ydata is None:
+            return
+        spline = self.get_fitted_spline(self.get_spline_type())
+        try:
+            spline.update_value(self.drag_index, event.ydata)
+        except ValueError as e:
+            self.statusbar.showMessage(f"Cannot move point: {e}", 3000)
+            return
+        # The fit may move more than one value (periodic ends move together)
+        self.y_points = np.array(spline.y_points, dtype=float)
+        
+        self.interp_line.set_ydata(spline(self.x_plot))
+        self.points_scatter.set_offsets(np.column_stack((self.x_points, self.y_points)))
+        self.canvas.draw_idle()
+
+    def on_drag_end(self, event):
+        """Finish dragging and refresh the table and the error"""
+        if self.drag_index is None:
+            return
+        index = self.drag_index
+        self.drag_index = None
+        last = len(self.y_points) - 1
+        rows = {index, last - index} if index in (0, last) else {index}
+        for row in rows:
+            self.ui.IL_TABEL_2.setItem(row, 1, QtWidgets.QTableWidgetItem(f"{self.y_points[row]:.6f}"))
+        spline_type = self.get_spline_type()
+        error = sf.calculate_error(self.x_points, self.y_points, spline_type,
+                                   spline=self.get_fitted_spline(spline_type))
+        self.ui.IS_TEXTFIELD_ERROR.setText(f"{error:.6f}")
@@ -1,38 +1,282 @@
 # animation_manager.py
 
-from matplotlib.animation import FuncAnimation
+import time
+from collections import deque
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class AnimationStats:
+    """Masuratori pentru o rulare a animatiei (timpi in secunde)."""
+
+    def __init__(self, history=1000):
+        self.frames_shown = 0
+        self.frames_dropped = 0
+        self.elapsed = 0.0
+        self.compute_times = deque(maxlen=history)
+        self.draw_times = deque(maxlen=history)
+        self.frame_times = deque(maxlen=history)
+
+    def record(self, compute_time, draw_time):
+        self.frames_shown += 1
+        self.compute_times.append(compute_time)
+        self.draw_times.append(draw_time)
+        self.frame_times.append(compute_time + draw_time)
+
+    @property
+    def achieved_fps(self):
+        return self.frames_shown / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bound(self):
+        # ce domina costul unui cadru: calculul datelor sau desenarea
+        compute = _percentile(self.compute_times, 50)
+        draw = _percentile(self.draw_times, 50)
+        return "compute" if compute >= draw else "render"
+
+    def summary(self):
+        return {
+            "fps": self.achieved_fps,
+            "frames_shown": self.frames_shown,
+            "frames_dropped": self.frames_dropped,
+            "frame_p50_ms": 1000 * _percentile(self.frame_times, 50),
+            "frame_p95_ms": 1000 * _percentile(self.frame_times, 95),
+            "compute_p50_ms": 1000 * _percentile(self.compute_times, 50),
+            "draw_p50_ms": 1000 * _percentile(self.draw_times, 50),
+            "bound": self.bound,
+        }
+
+    def __str__(self):
+        s = self.summary()
+        return (f"{s['fps']:.1f} fps | cadre: {s['frames_shown']} (sarite: {s['frames_dropped']}) | "
+                f"p50 {s['frame_p50_ms']:.1f} ms, p95 {s['frame_p95_ms']:.1f} ms | limitat de {s['bound']}")
+
 
 class AnimationManager:
-    def __init__(self, fig, update_func, frames_range, interval_ms=100):
-        self.animation = None
-        self.is_running = False
+    """Animatie cu blitting real pe canvasul unei figuri matplotlib.
+
+    init_func creeaza o singura data artistii persistenti si intoarce lista
+    celor care se schimba de la un cadru la altul. Restul figurii (grila,
+    functia tinta, legenda) se deseneaza o data si se pastreaza ca fundal;
+    update_func modifica doar artistii animati si ii intoarce.
+
+    Cadrele sunt programate dupa timp: cadrul i e datorat la (i + 1) / target_fps
+    secunde de la start, odata cu tick-ul timerului. Daca un cadru costa mai
+    mult decat perioada, cadrele ramase in urma sunt sarite (drop_frames=True),
+    iar ultimul cadru se afiseaza intotdeauna. In pauza, seek() deruleaza la
+    orice cadru. on_finished primeste AnimationStats la final.
+    """
+
+    def __init__(self, fig, update_func, frames_range, interval_ms=100, init_func=None,
+                 target_fps=None, drop_frames=True, on_finished=None):
         self.fig = fig
         self.update_func = update_func
+        self.init_func = init_func
         self.frames_range = frames_range
         self.interval_ms = interval_ms
+        self.target_fps = target_fps if target_fps else 1000.0 / interval_ms
+        self.drop_frames = drop_frames
+        self.on_finished = on_finished
+        self.stats = AnimationStats()
+        self.is_running = False
+        self.is_paused = False
+        self._timer = None
+        self._frames = []
+        self._frame_index = 0
+        self._start_time = 0.0
+        self._pause_time = 0.0
+        # avansul programului de cadre dupa seek(), in secunde
+        self._schedule_shift = 0.0
+        self._background = None
+        self._animated_artists = []
+        self._draw_cid = None
+
+    @property
+    def canvas(self):
+        return self.fig.canvas
+
+    @property
+    def frame_period(self):
+        return 1.0 / self.target_fps
 
     def start(self):
         if self.is_running:
             return
-        self.animation = FuncAnimation(
-            self.fig,
-            self.update_func,
-            frames=self.frames_range,
-            interval=self.interval_ms,
-            blit=True,
-            repeat=False
-        )
+        if self.is_paused:
+            self.resume()
+            return
+
+        self._animated_artists = list(self.init_func()) if self.init_func else []
+        for artist in self._animated_artists:
+            artist.set_animated(True)
+        self._frames = list(self.frames_range)
+        self._frame_index = 0
+        self._schedule_shift = 0.0
+        self.stats = AnimationStats()
+
+        # la fiecare redesenare completa (resize, zoom) fundalul se recaptureaza
+        self._draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.draw()
+
+        self._timer = self.canvas.new_timer(interval=max(1, int(1000 * self.frame_period)))
+        self._timer.add_callback(self._step)
+        self._start_time = time.perf_counter()
+        self._timer.start()
         self.is_running = True
-        self.fig.canvas.draw_idle() 
 
     def pause(self):
-        if self.animation and self.is_running:
-            # self.animation.event_source.stop()
+        if self._timer and self.is_running:
+            self._timer.stop()
+            self._pause_time = time.perf_counter()
             self.is_running = False
+            self.is_paused = True
+
+    def resume(self):
+        if self._timer and self.is_paused:
+            # timpul petrecut in pauza nu conteaza ca intarziere
+            self._start_time += time.perf_counter() - self._pause_time
+            self.is_paused = False
+            self.is_running = True
+            self._timer.start()
+
+    def seek(self, index):
+        """Afiseaza cadrul index cat timp animatia e in pauza; resume() continua de la el"""
+        if not self.is_paused:
+            return
+        index = max(0, min(index, len(self._frames) - 1))
+        self._frame_index = index + 1
+        # la reluare urmatorul cadru e datorat dupa o perioada, nu cel dupa timpul scurs
+        elapsed = self._pause_time - self._start_time
+        self._schedule_shift = self._frame_index * self.frame_period - elapsed
+        self._render(self._frames[index])
 
     def stop(self):
-        if self.animation:
-            # self.animation.event_source.stop()
-            self.animation = None
-            self.is_running = False
-        
+        finished = self._timer is not None
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
+            end_time = self._pause_time if self.is_paused else time.perf_counter()
+            self.stats.elapsed = end_time - self._start_time
+        if self._draw_cid is not None:
+            self.canvas.mpl_disconnect(self._draw_cid)
+            self._draw_cid = None
+        # artistii revin in desenarea normala, cu starea ultimului cadru
+        if self._animated_artists:
+            for artist in self._animated_artists:
+                artist.set_animated(False)
+            self._animated_artists = []
+            self.canvas.draw_idle()
+        self._background = None
+        self.is_running = False
+        self.is_paused = False
+        if finished and self.on_finished:
+            self.on_finished(self.stats)
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated(self._animated_artists)
+
+    def _draw_animated(self, artists):
+        for artist in artists:
+            self.fig.draw_artist(artist)
+
+    def _next_frame_index(self):
+        if not self.drop_frames:
+            return self._frame_index
+        # cadrul i e programat la (i+1) perioade de la start, cand soseste tick-ul lui
+        elapsed = time.perf_counter() - self._start_time + self._schedule_shift
+        due = int(elapsed / self.frame_period) - 1
+        due = min(due, len(self._frames) - 1)
+        if due < self._frame_index:
+            return self._frame_index
+        self.stats.frames_dropped += due - self._frame_index
+        return due
+
+    def _step(self):
+        if self._frame_index >= len(self._frames):
+            self.stop()
+            return
+        self._frame_index = self._next_frame_index()
+        frame = self._frames[self._frame_index]
+        self._frame_index += 1
+        self.stats.record(*self._render(frame))
+
+    def _render(self, frame):
+        # intoarce (timp de calcul, timp de desenare)
+        compute_start = time.perf_counter()
+        for artist in self.update_func(frame) or []:
+            if artist not in self._animated_artists:
+                artist.set_animated(True)
+                self._animated_artists.append(artist)
+
+        draw_start = time.perf_counter()
+        if self._background is None:
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_animated(self._animated_artists)
+            self.canvas.blit(self.fig.bbox)
+        return draw_start - compute_start, time.perf_counter() - draw_start
+
+
+class BlitOverlay:
+    """Artisti redesenati prin blitting peste fundalul static, in afara animatiilor.
+
+    Fundalul (fara artisti) se recaptureaza la fiecare desen complet al figurii
+    (resize, zoom), iar update() redeseneaza doar artistii: cativa ms in loc de
+    un desen complet. Inainte de o animatie pe aceiasi artisti se face detach().
+    """
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.artists = []
+        self._background = None
+        self._draw_cid = None
+
+    @property
+    def canvas(self):
+        return self.fig.canvas
+
+    @property
+    def is_attached(self):
+        return self._draw_cid is not None
+
+    def attach(self, artists):
+        # un singur desen complet: fundalul se salveaza in _on_draw, artistii se deseneaza peste
+        self.detach()
+        self.artists = list(artists)
+        for artist in self.artists:
+            artist.set_animated(True)
+        self._draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.draw()
+
+    def detach(self):
+        if self._draw_cid is not None:
+            self.canvas.mpl_disconnect(self._draw_cid)
+            self._draw_cid = None
+        for artist in self.artists:
+            artist.set_animated(False)
+        self.artists = []
+        self._background = None
+
+    def update(self):
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        for artist in self.artists:
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+
+    def _on_draw(self, event):
+        # la savefig (alt canvas) artistii se deseneaza doar in imaginea salvata
+        if event.canvas is self.canvas and hasattr(event.canvas, 'copy_from_bbox'):
+            self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self.artists:
+            artist.draw(event.renderer)
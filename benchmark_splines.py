@@ -0,0 +1,77 @@
+# benchmark_splines.py
+# Compara rezolvarea sistemului spline cubic: matrice densa + np.linalg.solve
+# fata de sistemul tridiagonal rezolvat in O(n); verifica si solverul ciclic. Rulare: python benchmark_splines.py
+
+import time
+import numpy as np
+
+from numerics import SplineFunctions as sf
+
+
+def moment_system(n):
+    x = np.linspace(0.0, 1.0, n + 1)
+    y = sf.target_function(x)
+    h = np.diff(x)
+    d = np.diff(y) / h
+    lower = np.zeros(n + 1)
+    diag = np.ones(n + 1)
+    upper = np.zeros(n + 1)
+    rhs = np.zeros(n + 1)
+    lower[1:n] = h[:-1]
+    diag[1:n] = 2 * (h[:-1] + h[1:])
+    upper[1:n] = h[1:]
+    rhs[1:n] = 6 * (d[1:] - d[:-1])
+    return lower, diag, upper, rhs
+
+
+def dense_solve(lower, diag, upper, rhs):
+    A = np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+    return np.linalg.solve(A, rhs)
+
+
+def check_cyclic(n=50, seed=0):
+    # colturi diferite (lower[0] != upper[-1]) ca sa prinda o corectie Sherman-Morrison inversata
+    rng = np.random.default_rng(seed)
+    lower, upper = rng.uniform(0.5, 1.5, n), rng.uniform(0.5, 1.5, n)
+    diag = 4 + rng.uniform(0, 1, n)
+    rhs = rng.standard_normal((n, 2))
+    A = np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+    A[0, -1], A[-1, 0] = lower[0], upper[-1]
+    error = np.max(np.abs(sf.solve_cyclic_tridiagonal(lower, diag, upper, rhs) - np.linalg.solve(A, rhs)))
+    assert error < 1e-10, f"solve_cyclic_tridiagonal difera de solutia densa: {error:.3e}"
+    return error
+
+
+def best_time(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"Sistem ciclic fata de np.linalg.solve: eroare maxima {check_cyclic():.2e}")
+    print(f"{'noduri':>10} {'dens [ms]':>12} {'tridiagonal [ms]':>18}")
+    crossover = None
+    for n in [10, 30, 100, 300, 1000, 3000, 6000]:
+        system = moment_system(n)
+        dense = best_time(dense_solve, *system)
+        banded = best_time(sf.solve_tridiagonal, *system)
+        if crossover is None and banded < dense:
+            crossover = n
+        print(f"{n:>10} {1000 * dense:>12.3f} {1000 * banded:>18.3f}")
+
+    # calea densa nu mai incape in memorie de aici incolo (n^2 elemente)
+    for n in [10**5, 10**6, 10**7]:
+        system = moment_system(n)
+        banded = best_time(sf.solve_tridiagonal, *system, repeat=1)
+        print(f"{n:>10} {'-':>12} {1000 * banded:>18.3f}")
+
+    if crossover is not None:
+        print(f"Tridiagonal devine mai rapid de la aproximativ {crossover} noduri.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# benchmark_startup.py
+# Masoara timpul de import, fiecare masuratoare intr-un proces Python nou:
+# nucleul numeric (fara Qt/matplotlib) si fereastra principala, pentru comparatie.
+# Rulare: python benchmark_startup.py
+
+import subprocess
+import sys
+
+CORE_MODULES = "numerics.BersteinFunctions, numerics.LagrangeFunctions, numerics.SplineFunctions"
+GUI_PACKAGES = {"PyQt5", "matplotlib"}
+CORE_BUDGET_MS = 100
+
+PROBE = """
+import sys, time
+{preload}
+start = time.perf_counter()
+import {modules}
+elapsed = time.perf_counter() - start
+loaded = sorted({{name.split('.')[0] for name in sys.modules}} & {gui})
+print(1000 * elapsed, ','.join(loaded) or '-')
+"""
+
+
+def import_time(modules, preload="", repeat=3):
+    # cel mai bun timp din cateva procese noi, plus pachetele GUI incarcate
+    best = float("inf")
+    loaded = "-"
+    for _ in range(repeat):
+        code = PROBE.format(modules=modules, preload=preload, gui=GUI_PACKAGES)
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        elapsed, loaded = output.stdout.split()
+        best = min(best, float(elapsed))
+    return best, loaded
+
+
+def main():
+    rows = [
+        ("numpy", "numpy", ""),
+        ("nucleu numeric", CORE_MODULES, ""),
+        ("nucleu (numpy deja incarcat)", CORE_MODULES, "import numpy"),
+        ("main_window", "main_window", ""),
+    ]
+    results = {}
+    print(f"{'import':>30} {'timp [ms]':>10}  GUI incarcat")
+    for label, modules, preload in rows:
+        elapsed, loaded = import_time(modules, preload)
+        results[label] = (elapsed, loaded)
+        print(f"{label:>30} {elapsed:>10.1f}  {loaded}")
+
+    core_ms, core_gui = results["nucleu (numpy deja incarcat)"]
+    if core_gui != "-":
+        print(f"Nucleul numeric importa module GUI: {core_gui}")
+    status = "OK" if core_ms < CORE_BUDGET_MS else "DEPASIT"
+    print(f"Nucleul numeric peste numpy: {core_ms:.1f} ms (buget {CORE_BUDGET_MS} ms) - {status}")
+
+
+if __name__ == "__main__":
+    main()
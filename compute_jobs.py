@@ -0,0 +1,134 @@
+# compute_jobs.py
+# Calcule grele pe fire de lucru (QThreadPool), cu rezultatul livrat pe firul GUI prin semnale.
+
+from PyQt5 import QtCore, QtWidgets
+
+
+class _JobSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object)
+
+
+class _Job(QtCore.QRunnable):
+    def __init__(self, task):
+        super().__init__()
+        # obiectul ramane al Python-ului, ca sa poata fi scos din coada cu tryTake
+        self.setAutoDelete(False)
+        self.task = task
+        self.signals = _JobSignals()
+
+    def run(self):
+        try:
+            result = self.task()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.done.emit(result)
+
+
+class ComputeJobs:
+    """Ruleaza functii fara argumente pe un QThreadPool si apeleaza callback-urile pe firul GUI.
+
+    Fiecare canal (de regula un tab) are cel mult un job curent. Un job nou il
+    inlocuieste pe cel vechi: daca acesta nu a pornit e scos din coada, altfel
+    rezultatul lui e ignorat. Cat timp exista joburi curente, in statusbar
+    apare un indicator de lucru.
+    """
+
+    def __init__(self, statusbar, max_threads=None):
+        self.statusbar = statusbar
+        self.pool = QtCore.QThreadPool()
+        if max_threads:
+            self.pool.setMaxThreadCount(max_threads)
+        self._current = {}
+        # referinte la joburile pornite, inclusiv cele inlocuite, pana la terminare
+        self._jobs = set()
+
+        self.busy_label = QtWidgets.QLabel("Se calculeaza...")
+        self.busy_bar = QtWidgets.QProgressBar()
+        self.busy_bar.setRange(0, 0)
+        self.busy_bar.setMaximumWidth(120)
+        self.busy_bar.setTextVisible(False)
+        for widget in (self.busy_label, self.busy_bar):
+            widget.hide()
+            statusbar.addPermanentWidget(widget)
+
+    def submit(self, channel, task, on_result, on_error=None):
+        """Porneste task() pe un fir de lucru; on_result(rezultat) sau on_error(exceptie) ruleaza pe firul GUI"""
+        self.cancel(channel)
+        job = _Job(task)
+        on_error = on_error or self.show_error
+        job.signals.done.connect(lambda result: self._finish(channel, job, on_result, result))
+        job.signals.failed.connect(lambda error: self._finish(channel, job, on_error, error))
+        self._current[channel] = job
+        self._jobs.add(job)
+        self._update_busy()
+        self.pool.start(job)
+        return job
+
+    def cancel(self, channel):
+        job = self._current.pop(channel, None)
+        if job is not None and self.pool.tryTake(job):
+            self._jobs.discard(job)
+        self._update_busy()
+
+    def is_busy(self, channel=None):
+        return channel in self._current if channel is not None else bool(self._current)
+
+    def wait(self, timeout_ms=-1):
+        """Asteapta terminarea joburilor si livreaza rezultatele (util la inchidere si in scripturi)"""
+        finished = self.pool.waitForDone(timeout_ms)
+        QtCore.QCoreApplication.processEvents()
+        return finished
+
+    def show_error(self, error):
+        self.statusbar.showMessage(f"Eroare de calcul: {error}", 5000)
+
+    def _finish(self, channel, job, callback, value):
+        self._jobs.discard(job)
+        is_current = self._current.get(channel) is job
+        if is_current:
+            del self._current[channel]
+        self._update_busy()
+        if is_current:
+            callback(value)
+
+    def _update_busy(self):
+        busy = bool(self._current)
+        self.busy_label.setVisible(busy)
+        self.busy_bar.setVisible(busy)
+
+
+class Debouncer:
+    """Comaseaza apelurile rapide (ex. valueChanged, textChanged).
+
+    Callback-ul ruleaza o singura data, cu argumentele ultimului apel, dupa
+    interval_ms fara alte apeluri. flush() il ruleaza imediat daca e in asteptare.
+    """
+
+    def __init__(self, interval_ms, callback):
+        self.callback = callback
+        self._args = ()
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._fire)
+
+    def __call__(self, *args):
+        self._args = args
+        self._timer.start()
+
+    @property
+    def is_pending(self):
+        return self._timer.isActive()
+
+    def flush(self):
+        if self._timer.isActive():
+            self._timer.stop()
+            self._fire()
+
+    def cancel(self):
+        self._timer.stop()
+
+    def _fire(self):
+        self.callback(*self._args)
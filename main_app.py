@@ -1,12 +1,30 @@
 # main_app.py
+# Optiuni: --prewarm importa in fundal modulele tab-urilor dupa prima afisare,
+#          --measure-startup afiseaza timpul pana la prima fereastra si iese.
+
+import time
+STARTUP_START = time.perf_counter()
 
 import sys
-from PyQt5 import QtWidgets
+from PyQt5 import QtCore, QtWidgets
 
 from main_window import MainWindow # Still imports MainWindow
 
+
+def on_first_paint(window, app):
+    elapsed_ms = 1000 * (time.perf_counter() - STARTUP_START)
+    print(f"Timp pana la prima fereastra: {elapsed_ms:.0f} ms")
+    window.ui.statusbar.showMessage(f"Pornire in {elapsed_ms:.0f} ms", 3000)
+    if "--measure-startup" in sys.argv:
+        app.quit()
+    elif "--prewarm" in sys.argv:
+        window.prewarm()
+
+
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    # primul ciclu al buclei de evenimente ruleaza dupa desenarea initiala a ferestrei
+    QtCore.QTimer.singleShot(0, lambda: on_first_paint(window, app))
     sys.exit(app.exec_())
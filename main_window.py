@@ -1,24 +1,22 @@
 # main_window.py
-import sys
-import re
-import math
+import importlib
+import threading
 
-from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtWidgets import QMessageBox
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
-from matplotlib.animation import FuncAnimation 
-import numpy as np 
-
-from plot_handler import PlotHandler
 #from ui_helpers import UIHelpers
 
-from LagrangeWindowImp import LagrangeWindowImp
-from BersteinWindowImp import BersteinWindowImp
-from SplineWindowImp import SplineWindowImp
 from ui_proiect import Ui_MainFrame
+from compute_jobs import ComputeJobs
+from numerics import target_functions as tf
+
+# tab -> (atribut, modul, clasa); modulele (si matplotlib odata cu ele) se importa la prima afisare
+TAB_WINDOWS = {
+    "tab": ("bernstein_window", "BersteinWindowImp", "BersteinWindowImp"),
+    "tab_2": ("lagrange_window", "LagrangeWindowImp", "LagrangeWindowImp"),
+    "tab_3": ("spline_window", "SplineWindowImp", "SplineWindowImp"),
+}
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -28,10 +26,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui.setupUi(self)
         
        # self.ui_helpers = UIHelpers(slider_scale_factor=100)
-        self.lagrange_window = LagrangeWindowImp(self.ui, self.ui.statusbar, self)
-        self.spline_window = SplineWindowImp(self.ui,self.ui.statusbar,self)
-        
-        self.bernstein_window = BersteinWindowImp(self.ui, self.ui.statusbar, self)
+        self.bernstein_window = None
+        self.lagrange_window = None
+        self.spline_window = None
+        self.prewarm_thread = None
+        # calculele grele ale tab-urilor ruleaza pe fire de lucru, cate un job curent pe tab
+        self.compute_jobs = ComputeJobs(self.ui.statusbar)
         self.ui.IL_TABEL.setColumnCount(2)
         self.ui.IL_TABEL.setHorizontalHeaderLabels(['X', 'Y'])
         
@@ -40,4 +40,68 @@ class MainWindow(QtWidgets.QMainWindow):
         self.lagrange_figure = None
         self.lagrange_canvas = None
         
-        self.ui.IL_BUTTON_ADAUGA.clicked.connect(LagrangeWindowImp.add_lagrange_point)
+        self.setup_function_input()
+        
+        # fiecare tab isi creeaza graficul si face primul calcul doar cand e afisat prima oara
+        self.ui.tabWidget.currentChanged.connect(self.ensure_tab)
+        self.ensure_tab(self.ui.tabWidget.currentIndex())
+
+    def ensure_tab(self, index):
+        tab = self.ui.tabWidget.widget(index)
+        if tab is None or tab.objectName() not in TAB_WINDOWS:
+            return None
+        attribute, module_name, class_name = TAB_WINDOWS[tab.objectName()]
+        window = getattr(self, attribute)
+        if window is None:
+            window_class = getattr(importlib.import_module(module_name), class_name)
+            window = window_class(self.ui, self.ui.statusbar, self)
+            setattr(self, attribute, window)
+        return window
+
+    def tab_windows(self):
+        return [window for window in (self.bernstein_window, self.lagrange_window, self.spline_window)
+                if window is not None]
+
+    def prewarm(self):
+        # dupa prima afisare: importurile grele (matplotlib, backend-ul Qt) se fac pe un fir separat;
+        # widget-urile raman pe firul GUI si se creeaza tot la prima afisare a tabului
+        if self.prewarm_thread is None:
+            self.prewarm_thread = threading.Thread(target=self._prewarm_worker, daemon=True)
+            self.prewarm_thread.start()
+
+    def _prewarm_worker(self):
+        for _, module_name, _ in TAB_WINDOWS.values():
+            importlib.import_module(module_name)
+
+    def setup_function_input(self):
+        # functia studiata e comuna celor trei metode, aleasa din registru sau scrisa ca expresie in x
+        self.function_combo = QtWidgets.QComboBox()
+        self.function_combo.setEditable(True)
+        self.function_combo.setInsertPolicy(QtWidgets.QComboBox.NoInsert)
+        self.function_combo.setMinimumWidth(220)
+        for name, expression in tf.FUNCTION_REGISTRY.items():
+            self.function_combo.addItem(expression)
+            self.function_combo.setItemData(self.function_combo.count() - 1, name, QtCore.Qt.ToolTipRole)
+        self.function_combo.setCurrentText(tf.get_target_function().expression)
+        self.function_combo.activated.connect(self.apply_target_function)
+        self.function_combo.lineEdit().returnPressed.connect(self.apply_target_function)
+        
+        function_widget = QtWidgets.QWidget()
+        function_layout = QtWidgets.QHBoxLayout(function_widget)
+        function_layout.setContentsMargins(0, 0, 0, 0)
+        function_layout.addWidget(QtWidgets.QLabel("f(x) ="))
+        function_layout.addWidget(self.function_combo)
+        self.ui.tabWidget.setCornerWidget(function_widget, QtCore.Qt.TopRightCorner)
+
+    def apply_target_function(self):
+        try:
+            previous = tf.get_target_function()
+            target = tf.set_target_function(self.function_combo.currentText())
+        except ValueError as e:
+            QMessageBox.warning(self, "Functie invalida", str(e))
+            return
+        if target is previous:
+            return
+        for window in self.tab_windows():
+            window.on_target_changed()
+        self.ui.statusbar.showMessage(f"Functia curenta: f(x) = {target.expression}", 3000)
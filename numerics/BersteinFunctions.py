@@ -0,0 +1,130 @@
+import math
+import numpy as np 
+
+from .byte_cache import ByteLRUCache
+from .target_functions import target_function, sample_grid, sample_nodes
+
+def map_to_unit_interval(y, a, b):
+    if a == b:
+        if y == a:
+            return 0.0 
+        else:
+            raise ValueError("ERROARE")
+    
+    return (y - a) / (b - a)
+
+def map_from_unit_interval(x, a, b):
+    return a + (b - a) * x
+
+# peste acest grad C(n,k) * x^k * (1-x)^(n-k) da overflow/underflow (NaN)
+DIRECT_MAX_DEGREE = 64
+
+def _direct_basis_matrix(x_unit, n_degree):
+    k = np.arange(n_degree + 1)
+    binomial_coeffs = np.array([math.comb(n_degree, i) for i in k], dtype=float)
+    return binomial_coeffs * (x_unit ** k) * ((1 - x_unit) ** (n_degree - k))
+
+def _log_basis_matrix(x_unit, n_degree):
+    # baza calculata in domeniul logaritmic, stabila pentru grade de ordinul miilor
+    k = np.arange(n_degree + 1)
+    log_binomial = np.concatenate(([0.0], np.cumsum(np.log(n_degree - k[1:] + 1) - np.log(k[1:]))))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_x = np.log(x_unit)
+        log_1mx = np.log1p(-x_unit)
+        # conventia 0 * log(0) = 0 pentru capetele intervalului
+        k_log_x = np.where(k == 0, 0.0, k * log_x)
+        rest_log_1mx = np.where(k == n_degree, 0.0, (n_degree - k) * log_1mx)
+    return np.exp(log_binomial + k_log_x + rest_log_1mx)
+
+def bernstein_basis_matrix(x_unit, n_degree, method="auto"):
+    x_unit = np.clip(np.asarray(x_unit, dtype=float).reshape(-1, 1), 0.0, 1.0)
+    if method == "auto":
+        method = "direct" if n_degree <= DIRECT_MAX_DEGREE else "log"
+    if method == "direct":
+        return _direct_basis_matrix(x_unit, n_degree)
+    if method == "log":
+        return _log_basis_matrix(x_unit, n_degree)
+    raise ValueError(f"Metoda necunoscuta: {method}")
+
+class BernsteinBasisCache(ByteLRUCache):
+    """Cache LRU pentru matricile bazei Bernstein pe grile uniforme din [0,1].
+
+    Baza depinde doar de grad si de numarul de puncte al grilei, nu si de
+    intervalul [a,b] sau de functie. Evacuarea se face dupa memoria ocupata;
+    poate fi folosit si de pe firele de lucru (vezi ByteLRUCache).
+    """
+
+    def __init__(self, max_bytes=128 * 1024 * 1024):
+        super().__init__(max_bytes)
+
+    def get(self, n_degree, num_points, method="auto"):
+        return self.lookup(
+            (n_degree, num_points, method),
+            lambda: bernstein_basis_matrix(np.linspace(0.0, 1.0, num_points), n_degree, method),
+        )
+
+basis_cache = BernsteinBasisCache()
+
+#aprox_berstein
+def aprox_berstein_on_interval(original_func, y_eval, n_degree, a, b, method="auto"):
+    if a >= b:
+        raise ValueError("Intervalul este ales gresit")
+
+    y_eval = np.asarray(y_eval, dtype=float)
+    x_transformed_eval = map_to_unit_interval(y_eval, a, b)
+
+    # functia se evalueaza o singura data, in cele n+1 noduri k/n
+    nodes = map_from_unit_interval(np.arange(n_degree + 1) / n_degree, a, b)
+    node_values = sample_nodes(nodes, original_func)
+
+    bernstein_sum = bernstein_basis_matrix(x_transformed_eval, n_degree, method) @ node_values
+    if y_eval.ndim == 0:
+        return float(bernstein_sum[0])
+    return bernstein_sum.reshape(y_eval.shape)
+
+def aprox_berstein_on_grid(original_func, n_degree, a, b, num_points=1000, method="auto"):
+    # varianta pe grila uniforma: baza vine din cache, ramane un singur produs matrice-vector
+    if a >= b:
+        raise ValueError("Intervalul este ales gresit")
+
+    x = np.linspace(a, b, num_points)
+    nodes = map_from_unit_interval(np.arange(n_degree + 1) / n_degree, a, b)
+    node_values = sample_nodes(nodes, original_func)
+    return x, basis_cache.get(n_degree, num_points, method) @ node_values
+
+def elevate_basis_matrix(basis, x_unit):
+    # recurenta b_{k,n+1}(x) = x * b_{k-1,n}(x) + (1-x) * b_{k,n}(x)
+    x_unit = np.asarray(x_unit, dtype=float).reshape(-1, 1)
+    elevated = np.empty((basis.shape[0], basis.shape[1] + 1))
+    elevated[:, :-1] = (1 - x_unit) * basis
+    elevated[:, -1] = 0.0
+    elevated[:, 1:] += x_unit * basis
+    return elevated
+
+def bernstein_frame_buffer(original_func, degrees, a, b, num_points=1000, method="auto"):
+    """Calculeaza toate cadrele animatiei intr-un singur tablou (cadre x puncte).
+
+    Gradele consecutive refolosesc baza pasului anterior prin ridicarea
+    gradului, celelalte iau baza din cache.
+    """
+    if a >= b:
+        raise ValueError("Intervalul este ales gresit")
+
+    x = np.linspace(a, b, num_points)
+    x_unit = np.linspace(0.0, 1.0, num_points)
+    frames = np.empty((len(degrees), num_points))
+    basis = None
+    previous_degree = None
+    for i, n_degree in enumerate(degrees):
+        if basis is not None and n_degree == previous_degree + 1:
+            basis = elevate_basis_matrix(basis, x_unit)
+        else:
+            basis = basis_cache.get(n_degree, num_points, method)
+        nodes = map_from_unit_interval(np.arange(n_degree + 1) / n_degree, a, b)
+        frames[i] = basis @ sample_nodes(nodes, original_func)
+        previous_degree = n_degree
+    return x, frames
+
+def calculeaza_eroarea_abs(bernstein_sum,original_func_value):
+    return abs(original_func_value-bernstein_sum)
+    
@@ -0,0 +1,213 @@
+import numpy as np
+from typing import List, Tuple, Optional
+import math
+
+from .target_functions import target_function, sample_grid, sample_nodes
+
+
+def _is_equispaced(x: np.ndarray) -> bool:
+    if x.size < 3:
+        return False
+    h = np.diff(x)
+    return bool(h[0] != 0 and np.allclose(h, h[0], rtol=1e-9, atol=0.0))
+
+def _equispaced_log_weights(x: np.ndarray) -> Tuple[np.ndarray, float]:
+    # forma inchisa in O(n): w_j = (-1)^(n-1-j) C(n-1, j) / (h^(n-1) (n-1)!)
+    n = x.size - 1
+    h = x[1] - x[0]
+    j = np.arange(1, n + 1)
+    log_binomial = np.concatenate(([0.0], np.cumsum(np.log(n - j + 1) - np.log(j))))
+    log_w = log_binomial - n * math.log(abs(h)) - math.lgamma(n + 1)
+    sign = np.where((n - np.arange(n + 1)) % 2 == 0, 1.0, -1.0) * (1.0 if h > 0 or n % 2 == 0 else -1.0)
+    log_scale = float(np.max(log_w))
+    return sign * np.exp(log_w - log_scale), log_scale
+
+def _barycentric_log_weights(x_points) -> Tuple[np.ndarray, float]:
+    # ponderile normalizate si logaritmul factorului scos: w_adevarat = w * exp(log_scale)
+    x = np.asarray(x_points, dtype=float)
+    if x.size == 0:
+        return np.empty(0), 0.0
+    if _is_equispaced(x):
+        return _equispaced_log_weights(x)
+    diff = x[:, None] - x[None, :]
+    np.fill_diagonal(diff, 1.0)
+    if np.any(diff == 0):
+        raise ValueError("Nodurile de interpolare trebuie sa fie distincte")
+    log_w = -np.sum(np.log(np.abs(diff)), axis=1)
+    sign = np.prod(np.sign(diff), axis=1)
+    log_scale = float(np.max(log_w))
+    return sign * np.exp(log_w - log_scale), log_scale
+
+def barycentric_weights(x_points) -> np.ndarray:
+    """Ponderile baricentrice w_j = 1 / prod_{k != j} (x_j - x_k).
+
+    Se calculeaza in domeniul logaritmic si se normalizeaza la maximul 1,
+    ca sa nu dea overflow/underflow pentru sute de noduri (forma a doua a
+    formulei baricentrice nu depinde de un factor comun).
+    """
+    return _barycentric_log_weights(x_points)[0]
+
+def barycentric_interpolation(x_points, y_points, x_eval, weights: Optional[np.ndarray] = None,
+                              max_block_size: int = 1 << 21) -> np.ndarray:
+    """Evalueaza interpolarea Lagrange (forma baricentrica a doua) pe un vector de puncte."""
+    x = np.asarray(x_points, dtype=float)
+    y = np.asarray(y_points, dtype=float)
+    w = barycentric_weights(x) if weights is None else weights
+    x_eval = np.asarray(x_eval, dtype=float)
+    flat_eval = x_eval.ravel()
+    result = np.empty_like(flat_eval)
+    # blocurile de linii tin matricea diferentelor sub max_block_size elemente
+    chunk_size = max(1, max_block_size // max(1, x.size))
+
+    for start in range(0, flat_eval.size, chunk_size):
+        block = flat_eval[start:start + chunk_size]
+        diff = block[:, None] - x[None, :]
+        exact = diff == 0
+        diff[exact] = 1.0
+        terms = w / diff
+        values = (terms @ y) / terms.sum(axis=1)
+        # punctele care coincid cu un nod primesc exact valoarea din nod
+        hit_rows, hit_nodes = np.nonzero(exact)
+        values[hit_rows] = y[hit_nodes]
+        result[start:start + chunk_size] = values
+
+    return result.reshape(x_eval.shape)
+
+class BarycentricInterpolant:
+    """Interpolant Lagrange: ponderile se calculeaza o data, evaluarea e vectoriala.
+
+    add_node si remove_node actualizeaza ponderile in O(n), fara recalcul.
+    """
+
+    def __init__(self, x_points=(), y_points=()):
+        self.x_points = np.asarray(x_points, dtype=float)
+        self.y_points = np.asarray(y_points, dtype=float)
+        self.weights, self._log_scale = _barycentric_log_weights(self.x_points)
+
+    def __len__(self):
+        return self.x_points.size
+
+    def __call__(self, x_eval):
+        if not len(self):
+            raise ValueError("Interpolantul nu are noduri")
+        return barycentric_interpolation(self.x_points, self.y_points, x_eval, self.weights)
+
+    def _renormalize(self):
+        peak = np.max(np.abs(self.weights)) if len(self) else 1.0
+        self.weights = self.weights / peak
+        self._log_scale += math.log(peak)
+
+    def add_node(self, x: float, y: float):
+        diff = self.x_points - x
+        if np.any(diff == 0):
+            raise ValueError("Nodurile de interpolare trebuie sa fie distincte")
+        # w_j <- w_j / (x_j - x), iar noul nod primeste 1 / prod (x - x_j) pe aceeasi scara
+        new_log_weight = -np.sum(np.log(np.abs(diff))) - self._log_scale
+        new_sign = np.prod(np.sign(-diff))
+        self.weights = np.append(self.weights / diff, new_sign * np.exp(new_log_weight))
+        self.x_points = np.append(self.x_points, x)
+        self.y_points = np.append(self.y_points, y)
+        self._renormalize()
+
+    def remove_node(self, index: int):
+        x_removed = self.x_points[index]
+        self.x_points = np.delete(self.x_points, index)
+        self.y_points = np.delete(self.y_points, index)
+        self.weights = np.delete(self.weights, index) * (self.x_points - x_removed)
+        self._renormalize()
+
+def chebyshev_nodes(a: float, b: float, num_nodes: int) -> np.ndarray:
+    """Nodurile Cebisev de speta I pe [a,b], in ordine crescatoare."""
+    k = np.arange(num_nodes)
+    t = -np.cos(np.pi * (2 * k + 1) / (2 * num_nodes))
+    return 0.5 * (a + b) + 0.5 * (b - a) * t
+
+def _dct2(values: np.ndarray) -> np.ndarray:
+    # DCT-II prin FFT de lungime 2n: X_k = sum_j f_j cos(pi k (2j+1) / 2n), in O(n log n)
+    n = values.size
+    spectrum = np.fft.rfft(np.concatenate((values, values[::-1])))[:n]
+    return 0.5 * np.real(np.exp(-1j * np.pi * np.arange(n) / (2 * n)) * spectrum)
+
+class ChebyshevInterpolant:
+    """Interpolare in nodurile Cebisev prin coeficientii seriei Cebisev.
+
+    Coeficientii se obtin din valorile in noduri cu o DCT in O(n log n),
+    iar evaluarea foloseste recurenta Clenshaw vectorizata pe tot vectorul.
+    """
+
+    def __init__(self, coefficients, a: float, b: float):
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.a = a
+        self.b = b
+
+    @classmethod
+    def from_values(cls, y_points, a: float, b: float) -> "ChebyshevInterpolant":
+        # y_points sunt valorile in chebyshev_nodes(a, b, n), in ordine crescatoare
+        values = np.asarray(y_points, dtype=float)[::-1]
+        coefficients = 2.0 / values.size * _dct2(values)
+        coefficients[0] /= 2
+        return cls(coefficients, a, b)
+
+    @classmethod
+    def from_function(cls, func, a: float, b: float, num_nodes: int) -> "ChebyshevInterpolant":
+        return cls.from_values(func(chebyshev_nodes(a, b, num_nodes)), a, b)
+
+    def __call__(self, x_eval):
+        x_eval = np.asarray(x_eval, dtype=float)
+        t = (2 * x_eval - (self.a + self.b)) / (self.b - self.a)
+        b_next = np.zeros_like(t)
+        b_next2 = np.zeros_like(t)
+        for c in self.coefficients[:0:-1]:
+            b_next, b_next2 = c + 2 * t * b_next - b_next2, b_next
+        return self.coefficients[0] + t * b_next - b_next2
+
+def nested_node_order(num_nodes: int) -> List[int]:
+    """Ordinea in care se adauga nodurile echidistante ca fiecare prefix sa fie bine distribuit.
+
+    Intai capetele, apoi mijloacele subintervalelor, nivel cu nivel.
+    """
+    if num_nodes <= 2:
+        return list(range(num_nodes))
+    order = [0, num_nodes - 1]
+    intervals = [(0, num_nodes - 1)]
+    while intervals:
+        next_intervals = []
+        for lo, hi in intervals:
+            if hi - lo < 2:
+                continue
+            mid = (lo + hi) // 2
+            order.append(mid)
+            next_intervals += [(lo, mid), (mid, hi)]
+        intervals = next_intervals
+    return order
+
+def lagrange_interpolation(x_points: List[float], y_points: List[float], x_eval: float) -> float:
+    result = barycentric_interpolation(x_points, y_points, x_eval)
+    if result.ndim == 0:
+        return float(result)
+    return result
+
+def calculate_interpolation_error(x_points: List[float], y_points: List[float], num_eval_points: int = 1000,
+                                  interpolant=None, a: Optional[float] = None,
+                                  b: Optional[float] = None) -> float:
+    """Eroarea maxima pe [a, b]; implicit intervalul acoperit de noduri."""
+    x_min = min(x_points) if a is None else a
+    x_max = max(x_points) if b is None else b
+    x_eval, actual = sample_grid(x_min, x_max, num_eval_points)
+    
+    if interpolant is None:
+        interpolant = BarycentricInterpolant(x_points, y_points)
+    interpolated = interpolant(x_eval)
+    return float(np.max(np.abs(interpolated - actual)))
+
+def compute_lagrange_curves(x_points: List[float], y_points: List[float], num_points: int = 1000,
+                            interpolant=None, a: Optional[float] = None,
+                            b: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Curbele pentru grafic: (x, interpolarea, functia tinta) pe num_points puncte din [a, b]
+    (implicit intervalul acoperit de noduri)."""
+    x_min = min(x_points) if a is None else a
+    x_max = max(x_points) if b is None else b
+    x_plot, y_target = sample_grid(x_min, x_max, num_points)
+    if interpolant is None:
+        interpolant = BarycentricInterpolant(x_points, y_points)
+    return x_plot, interpolant(x_plot), y_target
@@ -0,0 +1,710 @@
+import numpy as np
+
+from .target_functions import target_function, sample_grid, sample_nodes
+
+def solve_tridiagonal(lower, diag, upper, rhs):
+    """Solve a tridiagonal system in O(n) time and memory.
+
+    lower[i] multiplies x[i-1] and upper[i] multiplies x[i+1] in row i
+    (lower[0] and upper[-1] are ignored). Uses vectorised cyclic reduction,
+    which is stable for the diagonally dominant spline systems. rhs may be
+    (n,) or (n, k) for several right-hand sides.
+    """
+    lower = np.array(lower, dtype=float)
+    diag = np.array(diag, dtype=float)
+    upper = np.array(upper, dtype=float)
+    rhs = np.array(rhs, dtype=float)
+    lower[0] = 0.0
+    upper[-1] = 0.0
+    if rhs.ndim == 2:
+        lower, diag, upper = lower[:, None], diag[:, None], upper[:, None]
+    return _cyclic_reduction(lower, diag, upper, rhs)
+
+def _cyclic_reduction(a, b, c, d):
+    n = len(b)
+    if n == 1:
+        return d / b
+
+    # Eliminate the odd unknowns from every even row
+    even = slice(0, n, 2)
+    odd = slice(1, n, 2)
+    n_even = (n + 1) // 2
+    n_odd = n // 2
+
+    alpha = np.zeros_like(b[even])
+    gamma = np.zeros_like(b[even])
+    alpha[1:] = -a[even][1:] / b[odd][:n_even - 1]
+    gamma[:n_odd] = -c[even][:n_odd] / b[odd]
+
+    a_odd = np.zeros_like(b[even])
+    c_odd = np.zeros_like(b[even])
+    d_odd_prev = np.zeros_like(d[even])
+    d_odd_next = np.zeros_like(d[even])
+    a_odd_next = np.zeros_like(b[even])
+    c_odd_prev = np.zeros_like(b[even])
+    a_odd[1:] = a[odd][:n_even - 1]
+    c_odd_prev[1:] = c[odd][:n_even - 1]
+    d_odd_prev[1:] = d[odd][:n_even - 1]
+    a_odd_next[:n_odd] = a[odd]
+    c_odd[:n_odd] = c[odd]
+    d_odd_next[:n_odd] = d[odd]
+
+    x = np.empty_like(d)
+    x[even] = _cyclic_reduction(
+        alpha * a_odd,
+        b[even] + alpha * c_odd_prev + gamma * a_odd_next,
+        gamma * c_odd,
+        d[even] + alpha * d_odd_prev + gamma * d_odd_next,
+    )
+
+    # Back-substitute the odd unknowns from their even neighbours
+    x_next = np.zeros_like(x[odd])
+    x_next[:n_even - 1] = x[2::2]
+    x[odd] = (d[odd] - a[odd] * x[0:n - 1:2] - c[odd] * x_next) / b[odd]
+    return x
+
+def uniform_knot_step(x_points, rtol=1e-9):
+    """Common knot spacing when the knots are uniform (e.g. np.linspace), else None"""
+    if len(x_points) < 2:
+        return None
+    h = np.diff(x_points)
+    if h[0] > 0 and np.allclose(h, h[0], rtol=rtol, atol=0.0):
+        return (x_points[-1] - x_points[0]) / (len(x_points) - 1)
+    return None
+
+def _knot_values(y_points):
+    """Values with the knot axis first: (knots,) or (knots, datasets) for a 2-D y"""
+    y_points = np.array(y_points, dtype=float)
+    return y_points.T if y_points.ndim == 2 else y_points
+
+def _per_knot(h, values):
+    """Reshape a per-knot vector so it broadcasts against knot-first values"""
+    return h.reshape((-1,) + (1,) * (values.ndim - 1))
+
+class PiecewisePolynomialSpline:
+    """Fitted spline stored as per-interval polynomial coefficients.
+
+    coefficients[j, i] multiplies (x - x_i)**j on the interval [x_i, x_{i+1}],
+    so a fit is done once and evaluated many times over whole arrays. For a
+    batch of datasets sharing the knots, coefficients has a trailing dataset
+    axis and evaluation returns one row per dataset.
+    """
+
+    def __init__(self, x_points, coefficients, kind="spline", y_points=None, fit_options=None):
+        self.x_points = np.asarray(x_points, dtype=float)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.kind = kind
+        self.uniform_step = uniform_knot_step(self.x_points)
+        # Knot-first values and fit options, kept for local updates
+        self.y_points = y_points
+        self.fit_options = fit_options or {}
+        self.moments = None
+        self._integral_prefix = None
+
+    @property
+    def degree(self):
+        return self.coefficients.shape[0] - 1
+
+    @property
+    def is_batched(self):
+        return self.coefficients.ndim == 3
+
+    def interval_index(self, x_eval):
+        """Index of the interval containing each evaluation point"""
+        if self.uniform_step is not None:
+            # Uniform knots: O(1) index arithmetic instead of a binary search
+            i = np.floor((x_eval - self.x_points[0]) * (1.0 / self.uniform_step)).astype(np.intp)
+        else:
+            i = np.searchsorted(self.x_points, x_eval) - 1
+        return np.clip(i, 0, len(self.x_points) - 2)
+
+    def __call__(self, x_eval):
+        x_eval = np.asarray(x_eval, dtype=float)
+        i = self.interval_index(x_eval)
+        dx = x_eval - self.x_points[i]
+
+        if self.is_batched:
+            dx = dx[..., None]
+
+        # Horner scheme over the stored coefficients
+        result = self.coefficients[-1][i]
+        for c in self.coefficients[-2::-1]:
+            result = result * dx + c[i]
+        return np.moveaxis(result, -1, 0) if self.is_batched else result
+
+    def derivative(self, order=1):
+        """Spline of the order-th derivative, differentiating each piece's coefficients"""
+        c = self.coefficients
+        for _ in range(order):
+            if len(c) == 1:
+                c = np.zeros_like(c)
+                break
+            powers = np.arange(1, len(c)).reshape((-1,) + (1,) * (c.ndim - 1))
+            c = c[1:] * powers
+        return PiecewisePolynomialSpline(self.x_points, c, kind="derivative")
+
+    def antiderivative(self, x_eval):
+        """Integral of the spline from the first knot to each point.
+
+        Whole-interval integrals are summed once into a prefix array, so each
+        point costs one lookup plus one polynomial of the partial interval.
+        """
+        c = self.coefficients
+        powers = np.arange(1, len(c) + 1).reshape((-1,) + (1,) * (c.ndim - 1))
+        if self._integral_prefix is None:
+            h = _per_knot(np.diff(self.x_points), c[0])
+            pieces = np.sum(c * h ** powers / powers, axis=0)
+            self._integral_prefix = np.concatenate((np.zeros_like(pieces[:1]), np.cumsum(pieces, axis=0)))
+
+        x_eval = np.asarray(x_eval, dtype=float)
+        i = self.interval_index(x_eval)
+        dx = x_eval - self.x_points[i]
+        if self.is_batched:
+            dx = dx[..., None]
+
+        scaled = c / powers
+        result = scaled[-1][i]
+        for s in scaled[-2::-1]:
+            result = result * dx + s[i]
+        result = result * dx + self._integral_prefix[i]
+        return np.moveaxis(result, -1, 0) if self.is_batched else result
+
+    def integral(self, a, b):
+        """Definite integral over [a, b] (arrays broadcast), O(1) per range"""
+        return self.antiderivative(b) - self.antiderivative(a)
+
+    def update_value(self, index, value):
+        """Move the value at one knot and update the fit with as little work as possible.
+
+        Linear splines patch the two neighbouring intervals. Cubic splines
+        re-solve the moment system only in a window around the knot (the
+        influence of one node decays geometrically). Quadratic splines, whose
+        slope recurrence is global, and updates near the ends are refitted.
+        With periodic ends the first and last knot move together. If the
+        refit fails the previous values are restored and the error re-raised.
+        """
+        # Negative indices count from the end, as in y_points[index]
+        index = range(len(self.x_points))[index]
+        last = len(self.x_points) - 1
+        indices = [index]
+        if self.fit_options.get("bc_type") == "periodic" and index in (0, last):
+            indices = [0, last]
+        old_values = self.y_points[indices].copy()
+        self.y_points[indices] = value
+        self._integral_prefix = None
+        try:
+            if self.kind == "linear":
+                self._update_linear(index)
+            elif self.kind != "cubic" or not self._update_cubic(index, old_values[0]):
+                self._refit()
+        except ValueError:
+            self.y_points[indices] = old_values
+            raise
+
+    def _refit(self):
+        y_points = self.y_points.T if self.is_batched else self.y_points
+        fitted = fit_spline(self.x_points, y_points, self.kind, **self.fit_options)
+        self.coefficients = fitted.coefficients
+        self.y_points = fitted.y_points
+        self.moments = fitted.moments
+
+    def _update_linear(self, index):
+        intervals = np.arange(max(index - 1, 0), min(index, len(self.x_points) - 2) + 1)
+        y = self.y_points
+        h = _per_knot(self.x_points[intervals + 1] - self.x_points[intervals], y)
+        self.coefficients[0][intervals] = y[intervals]
+        self.coefficients[1][intervals] = (y[intervals + 1] - y[intervals]) / h
+
+    def _update_cubic(self, index, old_value, window=32):
+        n = len(self.x_points) - 1
+        h = np.diff(self.x_points)
+        y = self.y_points
+
+        # Only rows index-1..index+1 of the moment system change their right-hand side
+        rows = np.arange(index - 1, index + 2)
+        if rows[0] < 1 or rows[-1] > n - 1:
+            return False
+        y_old = y[rows[0] - 1:rows[-1] + 2].copy()
+        y_old[index - rows[0] + 1] = old_value
+        y_new = y[rows[0] - 1:rows[-1] + 2]
+        h_rows = _per_knot(h[rows[0] - 1:rows[-1] + 1], y)
+        d_old = np.diff(y_old, axis=0) / h_rows
+        d_new = np.diff(y_new, axis=0) / h_rows
+        delta_rhs = 6 * (np.diff(d_new, axis=0) - np.diff(d_old, axis=0))
+
+        while True:
+            # Not-a-knot and periodic ends change rows 0, 1, n-1 and n; stay clear of them
+            lo, hi = rows[0] - window, rows[-1] + window
+            if lo < 2 or hi > n - 2:
+                return False
+            r = np.arange(lo, hi + 1)
+            rhs = np.zeros((len(r),) + y.shape[1:])
+            rhs[rows[0] - lo:rows[-1] - lo + 1] = delta_rhs
+            delta_m = solve_tridiagonal(h[r - 1], 2 * (h[r - 1] + h[r]), h[r], rhs)
+            edge = max(np.max(np.abs(delta_m[0])), np.max(np.abs(delta_m[-1])))
+            if edge <= 1e-17 * max(np.max(np.abs(delta_m)), 1e-300):
+                break
+            window *= 2
+
+        self.moments[lo:hi + 1] += delta_m
+        intervals = slice(lo - 1, hi + 1)
+        knots = slice(lo - 1, hi + 2)
+        h_int = _per_knot(h[intervals], y)
+        d = np.diff(y[knots], axis=0) / h_int
+        self.coefficients[:, intervals] = _cubic_coefficients(h_int, d, y[knots], self.moments[knots])
+        return True
+
+def fit_linear_spline(x_points, y_points):
+    """Fit a linear spline"""
+    x_points = np.array(x_points, dtype=float)
+    y_points = _knot_values(y_points)
+    slopes = np.diff(y_points, axis=0) / _per_knot(np.diff(x_points), y_points)
+    return PiecewisePolynomialSpline(x_points, np.stack((y_points[:-1], slopes)), "linear", y_points)
+
+def fit_quadratic_spline(x_points, y_points):
+    """Fit a C1 quadratic spline whose first piece is a straight line"""
+    x_points = np.array(x_points, dtype=float)
+    y_points = _knot_values(y_points)
+    h = _per_knot(np.diff(x_points), y_points)
+    d = np.diff(y_points, axis=0) / h
+
+    # Knot slopes satisfy the bidiagonal system z[i] + z[i+1] = 2*d[i] with z[0] = d[0];
+    # with u[i] = (-1)**i * z[i] it becomes a prefix sum, solved in O(n)
+    signs = _per_knot(np.where(np.arange(len(h) + 1) % 2 == 0, 1.0, -1.0), y_points)
+    u = np.concatenate((d[:1], d[:1] - 2 * np.cumsum(signs[:-1] * d, axis=0)))
+    z = signs * u
+
+    # s(x) = a + b*dx + c*dx**2/2 on each interval
+    a = y_points[:-1]
+    b = z[:-1]
+    c = (z[1:] - z[:-1]) / h
+    return PiecewisePolynomialSpline(x_points, np.stack((a, b, c / 2)), "quadratic", y_points)
+
+def solve_cyclic_tridiagonal(lower, diag, upper, rhs):
+    """Solve a periodic tridiagonal system in O(n).
+
+    Same layout as solve_tridiagonal, except that lower[0] is the corner
+    entry A[0, n-1] and upper[-1] the corner entry A[n-1, 0]. The corners are
+    a rank-one correction (Sherman-Morrison), so both systems are solved
+    together as one two-column tridiagonal solve.
+    """
+    lower = np.array(lower, dtype=float)
+    diag = np.array(diag, dtype=float)
+    upper = np.array(upper, dtype=float)
+    rhs = np.array(rhs, dtype=float)
+    n = len(diag)
+    if n < 3:
+        raise ValueError("A periodic system needs at least 3 unknowns")
+
+    alpha, beta = lower[0], upper[-1]
+    gamma = -diag[0]
+    diag[0] -= gamma
+    diag[-1] -= alpha * beta / gamma
+    u = np.zeros(n)
+    u[0] = gamma
+    u[-1] = beta
+
+    columns = rhs.reshape(n, -1)
+    solution = solve_tridiagonal(lower, diag, upper, np.column_stack((columns, u)))
+    y, z = solution[:, :-1], solution[:, -1]
+    v_last = alpha / gamma
+    factor = (y[0] + v_last * y[-1]) / (1 + z[0] + v_last * z[-1])
+    return (y - z[:, None] * factor).reshape(rhs.shape)
+
+CUBIC_BOUNDARY_CONDITIONS = ("natural", "clamped", "not-a-knot", "periodic")
+
+def estimate_end_slopes(x_points, y_points):
+    """Second-order one-sided estimates of s'(a) and s'(b) from the data"""
+    y_points = _knot_values(y_points)
+    h = np.diff(x_points)
+    return _end_slopes(h, np.diff(y_points, axis=0) / _per_knot(h, y_points))
+
+def _end_slopes(h, d):
+    if len(h) < 2:
+        raise ValueError("Estimating end slopes needs at least 3 points; pass end_slopes explicitly")
+    start = d[0] - h[0] * (d[1] - d[0]) / (h[0] + h[1])
+    end = d[-1] + h[-1] * (d[-1] - d[-2]) / (h[-2] + h[-1])
+    return start, end
+
+def _cubic_moments(h, d, bc_type, end_slopes):
+    """Second derivatives M at the knots from the banded moment system"""
+    n = len(h)
+    rhs_interior = 6 * (d[1:] - d[:-1])
+
+    if bc_type == "periodic":
+        h_prev = np.roll(h, 1)
+        m = solve_cyclic_tridiagonal(h_prev, 2 * (h_prev + h), h, 6 * (d - np.roll(d, 1, axis=0)))
+        return np.concatenate((m, m[:1]))
+
+    if bc_type == "not-a-knot":
+        if n < 3:
+            raise ValueError("Not-a-knot cubic spline needs at least 4 points")
+        # M[0] and M[n] are eliminated with the third-derivative continuity
+        # conditions at x[1] and x[n-1]; the interior system stays tridiagonal
+        lower = h[:-1].copy()
+        diag = 2 * (h[:-1] + h[1:])
+        upper = h[1:].copy()
+        diag[0] += h[0] * (h[0] + h[1]) / h[1]
+        upper[0] -= h[0] ** 2 / h[1]
+        diag[-1] += h[-1] * (h[-2] + h[-1]) / h[-2]
+        lower[-1] -= h[-1] ** 2 / h[-2]
+        inner = solve_tridiagonal(lower, diag, upper, rhs_interior)
+        first = ((h[0] + h[1]) * inner[0] - h[0] * inner[1]) / h[1]
+        last = ((h[-2] + h[-1]) * inner[-1] - h[-1] * inner[-2]) / h[-2]
+        return np.concatenate(([first], inner, [last]))
+
+    lower = np.zeros(n + 1)
+    diag = np.ones(n + 1)
+    upper = np.zeros(n + 1)
+    rhs = np.zeros((n + 1,) + d.shape[1:])
+    lower[1:n] = h[:-1]
+    diag[1:n] = 2 * (h[:-1] + h[1:])
+    upper[1:n] = h[1:]
+    rhs[1:n] = rhs_interior
+
+    if bc_type == "clamped":
+        slope_start, slope_end = end_slopes
+        diag[0], upper[0], rhs[0] = 2 * h[0], h[0], 6 * (d[0] - slope_start)
+        lower[n], diag[n], rhs[n] = h[-1], 2 * h[-1], 6 * (slope_end - d[-1])
+    elif bc_type != "natural":
+        raise ValueError(f"Unknown boundary condition: {bc_type}")
+    # natural: M[0] = M[n] = 0 from the identity rows
+    return solve_tridiagonal(lower, diag, upper, rhs)
+
+def fit_cubic_spline(x_points, y_points, bc_type="natural", end_slopes=None):
+    """Fit a cubic spline with natural, clamped, not-a-knot or periodic ends.
+
+    For clamped ends, end_slopes = (s'(a), s'(b)); when omitted they are
+    estimated from the data.
+    """
+    x_points = np.array(x_points, dtype=float)
+    y_points = _knot_values(y_points)
+    user_end_slopes = end_slopes
+    if bc_type == "periodic":
+        if not np.all(np.isclose(y_points[0], y_points[-1])):
+            raise ValueError("Periodic spline needs equal values at both ends")
+        y_points[-1] = y_points[0]
+    h = np.diff(x_points)
+    d = np.diff(y_points, axis=0) / _per_knot(h, y_points)
+    if bc_type == "clamped" and end_slopes is None:
+        end_slopes = _end_slopes(h, d)
+    # One factorisation of the shared knot system serves every dataset column
+    m = _cubic_moments(h, d, bc_type, end_slopes)
+
+    coefficients = _cubic_coefficients(_per_knot(h, y_points), d, y_points, m)
+    spline = PiecewisePolynomialSpline(x_points, coefficients, "cubic", y_points,
+                                       {"bc_type": bc_type, "end_slopes": user_end_slopes})
+    spline.bc_type = bc_type
+    spline.end_slopes = end_slopes
+    spline.moments = m
+    return spline
+
+def _cubic_coefficients(h, d, y_points, m):
+    """Per-interval cubic coefficients from knot values and second derivatives"""
+    a = y_points[:-1]
+    b = d - h * (2 * m[:-1] + m[1:]) / 6
+    c = m[:-1] / 2
+    e = (m[1:] - m[:-1]) / (6 * h)
+    return np.stack((a, b, c, e))
+
+def cross_check_cubic_spline(spline, y_points, num_points=1000):
+    """Maximum difference against scipy's CubicSpline (SciPy is imported only here)"""
+    from scipy.interpolate import CubicSpline
+
+    bc_type = spline.bc_type
+    if bc_type == "clamped":
+        bc_type = ((1, spline.end_slopes[0]), (1, spline.end_slopes[1]))
+    reference = CubicSpline(spline.x_points, y_points, bc_type=bc_type, axis=-1)
+    x_dense = np.linspace(spline.x_points[0], spline.x_points[-1], num_points)
+    return float(np.max(np.abs(spline(x_dense) - reference(x_dense))))
+
+def solve_banded(band, rhs, bandwidth, use_scipy=True):
+    """Solve a banded system in O(n * bandwidth**2).
+
+    band[i, bandwidth + j - i] holds A[i, j] for |j - i| <= bandwidth.
+    SciPy's LAPACK banded solver is used when it is installed; it is imported
+    here on the first fit, never at startup. Without SciPy, or with
+    use_scipy=False, Gaussian elimination without pivoting is used instead,
+    which is stable for the totally positive B-spline collocation matrices
+    and the positive definite normal equations, but eliminates one row at a
+    time in Python.
+    """
+    if use_scipy:
+        try:
+            from scipy.linalg import solve_banded as lapack_solve_banded
+        except ImportError:
+            use_scipy = False
+    if not use_scipy:
+        return _eliminate_banded(np.array(band, dtype=float), np.array(rhs, dtype=float), bandwidth)
+
+    # LAPACK layout: ab[bandwidth + i - j, j] = A[i, j]
+    n = len(band)
+    ab = np.zeros((2 * bandwidth + 1, n))
+    for offset in range(-bandwidth, bandwidth + 1):
+        rows = np.arange(max(0, -offset), min(n, n - offset))
+        ab[bandwidth - offset, rows + offset] = band[rows, bandwidth + offset]
+    return lapack_solve_banded((bandwidth, bandwidth), ab, rhs)
+
+def _eliminate_banded(band, rhs, bandwidth):
+    n = len(band)
+    k = bandwidth
+    for i in range(n - 1):
+        r = np.arange(1, min(k, n - 1 - i) + 1)
+        factors = band[i + r, k - r] / band[i, k]
+        band[(i + r)[:, None], (k - r)[:, None] + np.arange(k + 1)] -= factors[:, None] * band[i, k:]
+        rhs[i + r] -= factors.reshape((-1,) + (1,) * (rhs.ndim - 1)) * rhs[i]
+
+    x = np.empty_like(rhs)
+    for i in range(n - 1, -1, -1):
+        c = np.arange(1, min(k, n - 1 - i) + 1)
+        x[i] = (rhs[i] - np.tensordot(band[i, k + c], x[i + c], axes=1)) / band[i, k]
+    return x
+
+def _bspline_basis(knots, degree, x_eval, span):
+    """Values of the degree+1 nonzero B-splines at each point (Cox-de Boor, vectorised)"""
+    basis = np.zeros((len(x_eval), degree + 1))
+    basis[:, 0] = 1.0
+    left = np.empty((len(x_eval), degree + 1))
+    right = np.empty((len(x_eval), degree + 1))
+    for j in range(1, degree + 1):
+        left[:, j] = x_eval - knots[span + 1 - j]
+        right[:, j] = knots[span + j] - x_eval
+        saved = np.zeros(len(x_eval))
+        for r in range(j):
+            temp = basis[:, r] / (right[:, r + 1] + left[:, j - r])
+            basis[:, r] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        basis[:, j] = saved
+    return basis
+
+class BSpline:
+    """Interpolating B-spline of arbitrary degree, evaluated with de Boor's algorithm.
+
+    knots is the full knot vector (degree+1 repeated end knots) and
+    coefficients has one row per B-spline, with a trailing dataset axis for
+    batched fits.
+    """
+
+    def __init__(self, knots, coefficients, degree, x_points=None, y_points=None, fit_options=None,
+                 kind="bspline"):
+        self.knots = np.asarray(knots, dtype=float)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.degree = degree
+        self.kind = kind
+        self.x_points = x_points
+        self.y_points = y_points
+        self.fit_options = fit_options or {}
+        self._antiderivative = None
+
+    @property
+    def is_batched(self):
+        return self.coefficients.ndim == 2
+
+    def span_index(self, x_eval):
+        """Knot span t[i] <= x < t[i+1] for each point, clipped to the valid range"""
+        k = self.degree
+        span = np.searchsorted(self.knots, x_eval, side='right') - 1
+        return np.clip(span, k, len(self.coefficients) - 1)
+
+    def __call__(self, x_eval):
+        x_eval = np.asarray(x_eval, dtype=float)
+        flat = x_eval.ravel()
+        k = self.degree
+        t = self.knots
+        span = self.span_index(flat)
+
+        # de Boor: start from the k+1 active coefficients and blend them down
+        d = self.coefficients[span[:, None] - k + np.arange(k + 1)]
+        for r in range(1, k + 1):
+            for j in range(k, r - 1, -1):
+                lo = t[span - k + j]
+                alpha = (flat - lo) / (t[span + 1 + j - r] - lo)
+                if self.is_batched:
+                    alpha = alpha[:, None]
+                d[:, j] = (1 - alpha) * d[:, j - 1] + alpha * d[:, j]
+
+        result = d[:, k]
+        if self.is_batched:
+            return result.T.reshape((-1,) + x_eval.shape)
+        return result.reshape(x_eval.shape)
+
+    def derivative(self, order=1):
+        """Spline of the order-th derivative: a B-spline of degree - order on the inner knots"""
+        t, c, k = self.knots, self.coefficients, self.degree
+        for _ in range(order):
+            if k == 0:
+                return BSpline(t, np.zeros_like(c), 0, kind="derivative")
+            span = _per_knot(t[k + 1:len(c) + k] - t[1:len(c)], c)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                c = np.where(span > 0, k * np.diff(c, axis=0) / span, 0.0)
+            t, k = t[1:-1], k - 1
+        return BSpline(t, c, k, kind="derivative")
+
+    def antiderivative(self, x_eval):
+        """Integral of the spline from the first knot to each point.
+
+        The antiderivative is a B-spline of one degree higher whose
+        coefficients are prefix sums of the scaled coefficients, built once.
+        """
+        if self._antiderivative is None:
+            t, c, k = self.knots, self.coefficients, self.degree
+            pieces = c * _per_knot(t[k + 1:] - t[:len(c)], c) / (k + 1)
+            coefficients = np.concatenate((np.zeros_like(c[:1]), np.cumsum(pieces, axis=0)))
+            knots = np.concatenate((t[:1], t, t[-1:]))
+            self._antiderivative = BSpline(knots, coefficients, k + 1, kind="antiderivative")
+        return self._antiderivative(x_eval)
+
+    def integral(self, a, b):
+        """Definite integral over [a, b] (arrays broadcast), O(1) per range"""
+        return self.antiderivative(b) - self.antiderivative(a)
+
+    def update_value(self, index, value):
+        """Move the value at one data point and refit (one O(n) banded solve)"""
+        old_value = np.array(self.y_points[index], dtype=float)
+        self.y_points[index] = value
+        self._antiderivative = None
+        y_points = self.y_points.T if self.is_batched else self.y_points
+        try:
+            fitted = fit_spline(self.x_points, y_points, self.kind, **self.fit_options)
+        except ValueError:
+            self.y_points[index] = old_value
+            raise
+        self.coefficients = fitted.coefficients
+        self.residual_norm = getattr(fitted, "residual_norm", None)
+
+def bspline_interpolation_knots(x_points, degree):
+    """Knot vector by knot averaging, which keeps the collocation system nonsingular"""
+    n = len(x_points)
+    windows = np.cumsum(np.concatenate(([0.0], x_points)))
+    interior = (windows[degree + 1:n] - windows[1:n - degree]) / degree if degree > 0 else x_points[1:-1]
+    return np.concatenate((np.full(degree + 1, x_points[0]), interior, np.full(degree + 1, x_points[-1])))
+
+def fit_bspline(x_points, y_points, degree=3):
+    """Fit an interpolating B-spline of any degree through the points.
+
+    The collocation matrix has at most degree+1 nonzeros per row; it is
+    assembled directly in banded form, so fitting is linear in the number
+    of points for a fixed degree.
+    """
+    x_points = np.array(x_points, dtype=float)
+    y_points = _knot_values(y_points)
+    n = len(x_points)
+    if degree < 1:
+        raise ValueError("B-spline degree must be at least 1")
+    if n < degree + 1:
+        raise ValueError(f"Degree {degree} B-spline needs at least {degree + 1} points")
+
+    knots = bspline_interpolation_knots(x_points, degree)
+    spline = BSpline(knots, np.zeros(n), degree, x_points, y_points, {"degree": degree})
+    span = spline.span_index(x_points)
+    basis = _bspline_basis(knots, degree, x_points, span)
+
+    # Row i has nonzeros in columns span[i]-degree .. span[i]
+    band = np.zeros((n, 2 * degree + 1))
+    rows = np.arange(n)[:, None]
+    band[rows, degree + (span[:, None] - degree + np.arange(degree + 1)) - rows] = basis
+    spline.coefficients = solve_banded(band, y_points, degree)
+    return spline
+
+def _banded_gram(columns, values, size, bandwidth):
+    """Band of sum_r v_r v_r^T, where row r has values[r, a] in column columns[r] + a"""
+    band = np.zeros((size, 2 * bandwidth + 1))
+    width = values.shape[1]
+    for a in range(width):
+        for b in range(width):
+            band[:, bandwidth + b - a] += np.bincount(columns + a, values[:, a] * values[:, b],
+                                                      minlength=size)[:size]
+    return band
+
+def fit_smoothing_spline(x_points, y_points, num_knots=None, smoothing=0.0, degree=3):
+    """Least-squares B-spline on a reduced set of uniform knots, with optional smoothing.
+
+    Minimises sum (y - s(x))^2 + smoothing * sum (second differences of the
+    coefficients)^2. The normal equations are banded, so the fit costs
+    O(len(x) * degree^2) to assemble plus O(num_knots * degree^2) to solve,
+    and the data need not be sorted. The residual 2-norm is stored on the
+    result as residual_norm.
+    """
+    x_points = np.asarray(x_points, dtype=float)
+    y_points = _knot_values(y_points)
+    n = len(x_points)
+    if degree < 1:
+        raise ValueError("B-spline degree must be at least 1")
+    if num_knots is None:
+        num_knots = int(min(max(n // 4, 2), 200))
+    if num_knots < 2:
+        raise ValueError("A smoothing spline needs at least 2 knots")
+    if smoothing < 0:
+        raise ValueError("The smoothing parameter must be non-negative")
+
+    a, b = np.min(x_points), np.max(x_points)
+    breaks = np.linspace(a, b, num_knots)
+    knots = np.concatenate((np.full(degree, a), breaks, np.full(degree, b)))
+    size = num_knots - 1 + degree
+    if smoothing == 0 and n < size:
+        raise ValueError(f"{size} coefficients need at least {size} points without smoothing")
+
+    options = {"num_knots": num_knots, "smoothing": smoothing, "degree": degree}
+    spline = BSpline(knots, np.zeros(size), degree, x_points, y_points, options, kind="smoothing")
+    span = spline.span_index(x_points)
+    basis = _bspline_basis(knots, degree, x_points, span)
+    columns = span - degree
+
+    # Normal equations (B^T B + smoothing * D^T D) c = B^T y, all in band form
+    bandwidth = max(degree, 2)
+    band = _banded_gram(columns, basis, size, bandwidth)
+    if smoothing > 0 and size > 2:
+        second_difference = np.tile([1.0, -2.0, 1.0], (size - 2, 1))
+        band += smoothing * _banded_gram(np.arange(size - 2), second_difference, size, bandwidth)
+    rhs = np.stack([sum(np.bincount(columns + j, basis[:, j] * y_column, minlength=size)[:size]
+                        for j in range(degree + 1))
+                    for y_column in y_points.reshape(n, -1).T], axis=-1)
+    if y_points.ndim == 1:
+        rhs = rhs[:, 0]
+
+    spline.coefficients = solve_banded(band, rhs, bandwidth)
+    residuals = spline(x_points) - (y_points.T if spline.is_batched else y_points)
+    spline.residual_norm = np.sqrt(np.sum(residuals ** 2, axis=-1))
+    return spline
+
+SPLINE_FITTERS = {
+    "linear": fit_linear_spline,
+    "quadratic": fit_quadratic_spline,
+    "cubic": fit_cubic_spline,
+    "bspline": fit_bspline,
+    "smoothing": fit_smoothing_spline,
+}
+
+def fit_spline(x_points, y_points, spline_type, **options):
+    """Fit a spline of the given type once, for repeated evaluation"""
+    try:
+        fitter = SPLINE_FITTERS[spline_type]
+    except KeyError:
+        raise ValueError(f"Unknown spline type: {spline_type}")
+    return fitter(x_points, y_points, **options)
+
+def linear_spline(x_points, y_points, x_eval):
+    """Calculate linear spline interpolation"""
+    return fit_linear_spline(x_points, y_points)(x_eval)
+
+def quadratic_spline(x_points, y_points, x_eval):
+    """Calculate quadratic spline interpolation"""
+    return fit_quadratic_spline(x_points, y_points)(x_eval)
+
+def cubic_spline(x_points, y_points, x_eval):
+    """Calculate cubic spline interpolation"""
+    return fit_cubic_spline(x_points, y_points)(x_eval)
+
+def calculate_error(x_points, y_points, spline_type, spline=None, **options):
+    """Calculate the maximum error of the spline interpolation"""
+    # Dense grid and target values, shared through the sample cache
+    x_min, x_max = np.min(x_points), np.max(x_points)
+    x_dense, y_actual = sample_grid(x_min, x_max, 1000)
+    
+    # Reuse an existing fit when the caller already has one
+    if spline is None:
+        spline = fit_spline(x_points, y_points, spline_type, **options)
+    y_interp = spline(x_dense)
+    
+    # Calculate maximum absolute error
+    return np.max(np.abs(y_actual - y_interp))
@@ -0,0 +1,7 @@
+"""Numerical core of InterPlot, independent of Qt and matplotlib.
+
+BersteinFunctions, LagrangeFunctions and SplineFunctions hold the three
+methods; target_functions holds the shared target and its sample cache, and
+byte_cache the memory-bounded LRU cache behind it and the Bernstein basis cache.
+Only NumPy is imported here; SciPy is loaded lazily where it is used.
+"""
@@ -0,0 +1,71 @@
+"""Thread-safe LRU cache for NumPy results, bounded by the memory it holds.
+
+Shared by the Bernstein basis cache and the target sample cache. Values are
+arrays or tuples of arrays; they are made read-only before being stored,
+so one copy can be handed to every window and worker thread.
+"""
+import threading
+from collections import OrderedDict
+
+
+class ByteLRUCache:
+    """LRU cache that evicts the least recently used entries once the stored
+    arrays exceed max_bytes.
+
+    The value is computed outside the lock, so threads missing on different
+    keys do not wait for each other; two threads missing on the same key
+    both compute it and the first result is kept.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key, compute, key_bytes=0):
+        """Return the value stored under key, computing and storing it on a miss.
+
+        key_bytes counts memory held by the key itself (e.g. node values
+        used as the key) towards the limit.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = compute()
+        arrays = value if isinstance(value, tuple) else (value,)
+        for array in arrays:
+            array.setflags(write=False)
+        size = sum(array.nbytes for array in arrays) + key_bytes
+        with self._lock:
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (value, size)
+                self.current_bytes += size
+                while self.current_bytes > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self.current_bytes -= evicted_size
+                    self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,201 @@
+"""Shared target functions for all three methods.
+
+Expressions in x (e.g. "cos(pi*x)") are parsed once, checked against a
+whitelist of NumPy functions and compiled to a vectorised callable; the
+compiled form is cached by expression text. Samples of the target on grids
+and node sets are memoised in a shared, size-bounded cache.
+"""
+import ast
+from functools import lru_cache
+
+import numpy as np
+
+from .byte_cache import ByteLRUCache
+
+# name -> (numpy function, number of arguments)
+ALLOWED_FUNCTIONS = {
+    "sin": (np.sin, 1), "cos": (np.cos, 1), "tan": (np.tan, 1),
+    "arcsin": (np.arcsin, 1), "arccos": (np.arccos, 1), "arctan": (np.arctan, 1),
+    "sinh": (np.sinh, 1), "cosh": (np.cosh, 1), "tanh": (np.tanh, 1),
+    "exp": (np.exp, 1), "log": (np.log, 1), "log10": (np.log10, 1), "sqrt": (np.sqrt, 1),
+    "abs": (np.abs, 1), "sign": (np.sign, 1), "floor": (np.floor, 1), "ceil": (np.ceil, 1),
+    "arctan2": (np.arctan2, 2), "hypot": (np.hypot, 2),
+    "minimum": (np.minimum, 2), "maximum": (np.maximum, 2),
+}
+ALLOWED_CONSTANTS = {"pi": np.pi, "e": np.e}
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.UAdd, ast.USub)
+
+DEFAULT_EXPRESSION = "cos(pi*x)"
+FUNCTION_REGISTRY = {
+    "cos(πx)": DEFAULT_EXPRESSION,
+    "Runge": "1/(1+25*x**2)",
+    "sin(2πx)": "sin(2*pi*x)",
+    "|x|": "abs(x)",
+    "Gauss": "exp(-x**2)",
+}
+
+
+class TargetFunction:
+    """Compiled expression in x, evaluated over whole arrays."""
+
+    def __init__(self, expression, code):
+        self.expression = expression
+        self._code = code
+        self._namespace = {name: func for name, (func, _) in ALLOWED_FUNCTIONS.items()}
+        self._namespace.update(ALLOWED_CONSTANTS)
+
+    def __call__(self, val):
+        x = np.asarray(val, dtype=float)
+        try:
+            with np.errstate(all='ignore'):
+                values = eval(self._code, {"__builtins__": {}}, dict(self._namespace, x=x))
+        except ArithmeticError as e:
+            # operatiile doar intre constante se fac in Python, nu in NumPy
+            raise ValueError(f"Expresia nu se poate evalua: {e}") from None
+        values = np.asarray(values, dtype=float)
+        # si expresiile constante intorc cate o valoare pentru fiecare punct
+        if values.shape != x.shape:
+            values = np.broadcast_to(values, x.shape).copy()
+        elif np.shares_memory(values, x):
+            # "x" intoarce chiar tabloul primit; rezultatul trebuie sa fie al nostru
+            values = values.copy()
+        return values if values.ndim else values[()]
+
+    def __repr__(self):
+        return f"TargetFunction({self.expression!r})"
+
+
+def _check_node(node):
+    if isinstance(node, ast.Expression):
+        _check_node(node.body)
+    elif isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"Constanta nepermisa: {node.value!r}")
+        # constantele devin float, ca puterile mari sa nu fie calculate exact in Python
+        node.value = float(node.value)
+    elif isinstance(node, ast.Name):
+        if node.id != "x" and node.id not in ALLOWED_CONSTANTS:
+            raise ValueError(f"Nume necunoscut: {node.id}")
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, _OPERATORS):
+        _check_node(node.left)
+        _check_node(node.right)
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, _OPERATORS):
+        _check_node(node.operand)
+    elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        if node.func.id not in ALLOWED_FUNCTIONS:
+            raise ValueError(f"Functie nepermisa: {node.func.id}")
+        arity = ALLOWED_FUNCTIONS[node.func.id][1]
+        if node.keywords or len(node.args) != arity:
+            raise ValueError(f"{node.func.id} primeste {arity} argument(e)")
+        for arg in node.args:
+            _check_node(arg)
+    else:
+        raise ValueError(f"Expresie nepermisa: {type(node).__name__}")
+
+
+@lru_cache(maxsize=64)
+def _compile(expression):
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Expresie invalida: {e.msg}") from None
+    _check_node(tree)
+    function = TargetFunction(expression, compile(tree, "<target>", "eval"))
+    # o evaluare de proba prinde din start erorile dintre constante (ex. 1/0)
+    function(np.zeros(1))
+    return function
+
+
+def compile_expression(expression):
+    """Compile a registry name or an expression in x; identical expressions share one compiled form."""
+    expression = FUNCTION_REGISTRY.get(expression, expression).strip()
+    if not expression:
+        raise ValueError("Introdu o functie")
+    return _compile(expression)
+
+
+def register_function(name, expression):
+    """Add a named expression to the registry after checking that it compiles"""
+    compile_expression(expression)
+    FUNCTION_REGISTRY[name] = expression
+
+
+_current_target = compile_expression(DEFAULT_EXPRESSION)
+
+
+def get_target_function():
+    return _current_target
+
+
+def set_target_function(expression):
+    """Make the expression (or registry name) the target used by all methods"""
+    global _current_target
+    _current_target = compile_expression(expression)
+    return _current_target
+
+
+def target_function(val):
+    """Current target function, vectorised over arrays"""
+    return _current_target(val)
+
+
+def evaluate(func, points):
+    """Evaluate func over an array, point by point only for scalar-only callables (ex. math.cos)"""
+    points = np.asarray(points, dtype=float)
+    try:
+        values = np.asarray(func(points), dtype=float)
+        if values.shape == points.shape:
+            # functiile de tip identitate intorc tabloul apelantului, pe care cache-ul l-ar ingheta
+            return values.copy() if np.shares_memory(values, points) else values
+    except TypeError:
+        pass
+    return np.array([func(p) for p in points.ravel()], dtype=float).reshape(points.shape)
+
+
+def _resolve_function(func):
+    # target_function urmeaza tinta curenta; in cache conteaza tinta, nu functia de delegare
+    func = _current_target if func is None or func is target_function else func
+    return func, getattr(func, "expression", func)
+
+
+class SampleCache(ByteLRUCache):
+    """Cache LRU pentru esantionarile functiilor pe grile uniforme si pe seturi de noduri.
+
+    Cheia e (functia, intervalul, numarul de puncte) sau (functia, nodurile).
+    Tablourile intoarse sunt read-only si partajate intre ferestre si fire de
+    lucru; evacuarea se face dupa memoria ocupata.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        super().__init__(max_bytes)
+
+    def grid(self, a, b, num_points=1000, func=None):
+        """(x, f(x)) on np.linspace(a, b, num_points)"""
+        func, func_key = _resolve_function(func)
+        key = ("grid", func_key, float(a), float(b), int(num_points))
+
+        def compute():
+            x = np.linspace(a, b, num_points)
+            return x, evaluate(func, x)
+        return self.lookup(key, compute)
+
+    def nodes(self, points, func=None):
+        """f at an arbitrary node set, keyed on the node values themselves"""
+        func, func_key = _resolve_function(func)
+        points = np.ascontiguousarray(points, dtype=float)
+        node_bytes = points.tobytes()
+        key = ("nodes", func_key, points.shape, node_bytes)
+        return self.lookup(key, lambda: evaluate(func, points), len(node_bytes))
+
+
+sample_cache = SampleCache()
+
+
+def sample_grid(a, b, num_points=1000, func=None):
+    """Cached (x, f(x)) on a uniform grid; both arrays are read-only"""
+    return sample_cache.grid(a, b, num_points, func)
+
+
+def sample_nodes(points, func=None):
+    """Cached f(points) for a node set; the array is read-only"""
+    return sample_cache.nodes(points, func)
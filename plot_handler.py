@@ -3,10 +3,10 @@ import numpy as np
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-from matplotlib.animation import FuncAnimation
 from PyQt5 import QtWidgets
 
-import BersteinFunctions as bnf
+from numerics import BersteinFunctions as bnf
+from animation_manager import AnimationManager
 
 class PlotHandler:
     def __init__(self, parent_widget, initial_interval_a, initial_interval_b):
@@ -37,9 +37,8 @@ class PlotHandler:
         a = self.interval_1
         b = self.interval_2
 
-        y_values = np.linspace(a, b, num_points)
-        original_func_values = [bnf.target_function(y) for y in y_values]
-        bernstein_approx_values = [bnf.aprox_berstein_on_interval(bnf.target_function, y, n_degree, a, b) for y in y_values]
+        y_values, bernstein_approx_values = bnf.aprox_berstein_on_grid(bnf.target_function, n_degree, a, b, num_points)
+        _, original_func_values = bnf.sample_grid(a, b, num_points)
 
         self.original_line, = self.axes.plot(y_values, original_func_values, label='Functia Originala $f(y)$', color='blue', linestyle='-')
         self.approx_line, = self.axes.plot(y_values, bernstein_approx_values, label=f'Aproximare Bernstein ($n={n_degree}$)', color='red', linestyle='--')
@@ -58,37 +57,36 @@ class PlotHandler:
     def _update_animation_frame(self, frame_degree):
         a = self.interval_1
         b = self.interval_2
-        y_values = np.linspace(a, b, 200)
-        bernstein_approx_values = [bnf.aprox_berstein_on_interval(bnf.target_function, y, frame_degree, a, b) for y in y_values]
+        _, bernstein_approx_values = bnf.aprox_berstein_on_grid(bnf.target_function, frame_degree, a, b, 200)
 
         self.approx_line.set_ydata(bernstein_approx_values)
-        self.approx_line.set_label(f'Aproximare Bernstein ($n={frame_degree}$)')
 
-        if self.axes.get_legend():
-             self.axes.get_legend().remove()
-        self.axes.legend()
-        self.axes.set_title(f"Aproximare Bernstein pe intervalul $[{a:.2f}, {b:.2f}]$ (Grad $n={frame_degree}$)")
-
-        return self.approx_line, self.original_line, 
+        return self.approx_line,
 
     def start_animation(self, min_degree, max_degree):
         if self.is_animating:
             return
         self.is_animating = True
-        self.plot_approximation(n_degree=min_degree) 
 
-        self.animation = FuncAnimation(
+        def init_animation():
+            approx_line, _ = self.plot_approximation(n_degree=min_degree)
+            # titlul si legenda raman in fundalul static
+            self.axes.set_title(f"Aproximare Bernstein pe intervalul $[{self.interval_1:.2f}, {self.interval_2:.2f}]$ "
+                                f"(Grad $n={min_degree}..{max_degree}$)")
+            return [approx_line]
+
+        self.animation = AnimationManager(
             self.figure,
             self._update_animation_frame,
-            frames=range(min_degree, max_degree + 1),
-            interval=self.anim_interval_ms,
-            blit=True,
-            repeat=False
+            range(min_degree, max_degree + 1),
+            interval_ms=self.anim_interval_ms,
+            init_func=init_animation
         )
-        self.canvas.draw_idle()
+        self.animation.start()
 
     def stop_animation(self):
         if self.animation:
+            self.animation.stop()
             self.animation = None
             self.is_animating = False
         else: